@@ -19,10 +19,11 @@ import re
 import html as html_lib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Iterable
+from typing import Dict, Any, List, Optional, Iterable, Tuple
 from bs4 import BeautifulSoup
 import unicodedata
 import hashlib
+from functools import lru_cache
 
 # Import existing parser infrastructure
 from metricas_lattes.parser_router import parse_fixture, PARSER_REGISTRY
@@ -116,19 +117,26 @@ def normalize_html_text(raw_bytes: bytes) -> str:
 
 
 def normalize_nested_text(value: Any, *, exclude_keys: Optional[set] = None) -> Any:
-    if isinstance(value, dict):
-        normalized = {}
-        for key, item in value.items():
-            if exclude_keys and key in exclude_keys:
-                normalized[key] = item
-            else:
-                normalized[key] = normalize_nested_text(item, exclude_keys=exclude_keys)
-        return normalized
-    if isinstance(value, list):
-        return [normalize_nested_text(item, exclude_keys=exclude_keys) for item in value]
-    if isinstance(value, str):
-        return normalize_text(value, unescape_html=True)
-    return value
+    # Repeated leaves (types, venues, author lists) are normalized only once per call
+    normalized_strings: Dict[str, str] = {}
+    exclude = exclude_keys or ()
+
+    def walk(node: Any) -> Any:
+        if isinstance(node, dict):
+            return {
+                key: item if key in exclude else walk(item)
+                for key, item in node.items()
+            }
+        if isinstance(node, list):
+            return [walk(item) for item in node]
+        if isinstance(node, str):
+            normalized = normalized_strings.get(node)
+            if normalized is None:
+                normalized = normalized_strings[node] = normalize_text(node, unescape_html=True)
+            return normalized
+        return node
+
+    return walk(value)
 
 
 def _basic_schema_validation(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
@@ -166,25 +174,25 @@ def validate_against_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> Lis
     return errors
 
 
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """
     Convert text to URL-safe slug.
 
     Example: "Leonardo Fernandes Fraceto" -> "leonardo-fernandes-fraceto"
     """
-    # Normalize unicode (NFD decomposition)
-    text = unicodedata.normalize('NFD', text)
-    # Remove combining marks
-    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-    # Lowercase
-    text = text.lower()
-    # Replace spaces and special chars with hyphens
-    text = re.sub(r'[^a-z0-9]+', '-', text)
+    # ASCII input has no combining marks to strip
+    if not text.isascii():
+        # Normalize unicode (NFD decomposition) and remove combining marks
+        text = unicodedata.normalize('NFD', text)
+        text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+    # Lowercase, then replace runs of spaces/special chars with one hyphen
+    text = _SLUG_SEPARATOR_RE.sub('-', text.lower())
     # Remove leading/trailing hyphens
-    text = text.strip('-')
-    # Collapse multiple hyphens
-    text = re.sub(r'-+', '-', text)
-    return text
+    return text.strip('-')
 
 
 def extract_lattes_id_from_filename(filename: str) -> Optional[str]:
@@ -203,7 +211,22 @@ def extract_lattes_id_from_filename(filename: str) -> Optional[str]:
     return None
 
 
-def extract_researcher_metadata_from_html(html_path: Path) -> Dict[str, Any]:
+def load_profile_document(html_path: Path) -> Tuple[str, BeautifulSoup]:
+    """
+    Read and parse a full_profile HTML once.
+
+    Returns (normalized html text, soup) for reuse by the extract_* functions.
+    """
+    with open(html_path, 'rb') as f:
+        raw_bytes = f.read()
+    html = normalize_html_text(raw_bytes)
+    return html, BeautifulSoup(html, 'lxml')
+
+
+def extract_researcher_metadata_from_html(
+    html_path: Path,
+    document: Optional[Tuple[str, BeautifulSoup]] = None,
+) -> Dict[str, Any]:
     """
     Extract researcher metadata from full_profile HTML.
 
@@ -212,13 +235,11 @@ def extract_researcher_metadata_from_html(html_path: Path) -> Dict[str, Any]:
     - full_name
     - slug (generated from name)
 
+    Pass `document` (from load_profile_document) to skip re-reading the file.
+
     Returns dict with metadata.
     """
-    with open(html_path, 'rb') as f:
-        raw_bytes = f.read()
-    html = normalize_html_text(raw_bytes)
-
-    soup = BeautifulSoup(html, 'lxml')
+    html, soup = document or load_profile_document(html_path)
 
     metadata = {
         'lattes_id': None,
@@ -251,20 +272,21 @@ def extract_researcher_metadata_from_html(html_path: Path) -> Dict[str, Any]:
     return metadata
 
 
-def extract_production_sections_from_html(html_path: Path) -> List[Dict[str, Any]]:
+def extract_production_sections_from_html(
+    html_path: Path,
+    document: Optional[Tuple[str, BeautifulSoup]] = None,
+) -> List[Dict[str, Any]]:
     """
     Extract all production sections from full_profile HTML.
 
+    Pass `document` (from load_profile_document) to skip re-reading the file.
+
     Returns list of dicts with:
     - section_title: Title of production section
     - html_content: HTML content of section
     - item_count: Number of items found
     """
-    with open(html_path, 'rb') as f:
-        raw_bytes = f.read()
-    html = normalize_html_text(raw_bytes)
-
-    soup = BeautifulSoup(html, 'lxml')
+    _, soup = document or load_profile_document(html_path)
     sections = []
 
     def _count_items(fragment_html: str) -> int:
@@ -487,6 +509,9 @@ def _apply_citacao_fallbacks(items: List[Dict[str, Any]]) -> None:
                     item['veiculo'] = veiculo_ou_livro
 
 
+_RAW_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+
 def _infer_year_from_item(item: Dict[str, Any]) -> Optional[int]:
     ano = item.get('ano')
     if isinstance(ano, int):
@@ -495,7 +520,7 @@ def _infer_year_from_item(item: Dict[str, Any]) -> Optional[int]:
         return int(ano.strip())
 
     raw = item.get('raw') or ''
-    matches = re.findall(r'\b(?:19|20)\d{2}\b', raw)
+    matches = _RAW_YEAR_RE.findall(raw)
     if matches:
         return int(matches[-1])
     return None
@@ -508,15 +533,9 @@ def filter_productions_by_year(
     if allowed_years is None:
         return list(items)
 
-    allowed_set = {int(year) for year in allowed_years}
-    filtered: List[Dict[str, Any]] = []
-    for item in items:
-        year = _infer_year_from_item(item)
-        if year is None:
-            continue
-        if year in allowed_set:
-            filtered.append(item)
-    return filtered
+    allowed_set = frozenset(int(year) for year in allowed_years)
+    # Items without an inferable year yield None, which is never in allowed_set
+    return [item for item in items if _infer_year_from_item(item) in allowed_set]
 
 
 def process_researcher_file(
@@ -566,8 +585,11 @@ def process_researcher_file(
         # Priority 1: From filename
         lattes_id_from_filename = extract_lattes_id_from_filename(filepath.name)
 
+        # Read + parse the HTML once for both extraction steps
+        document = load_profile_document(filepath)
+
         # Fallback: From HTML
-        metadata = extract_researcher_metadata_from_html(filepath)
+        metadata = extract_researcher_metadata_from_html(filepath, document)
 
         # Use filename ID if available, otherwise HTML ID
         result['lattes_id'] = lattes_id_from_filename or metadata['lattes_id'] or 'unknown'
@@ -576,7 +598,7 @@ def process_researcher_file(
         result['last_update'] = metadata.get('last_update')
 
         # Step 2: Extract production sections
-        sections_html = extract_production_sections_from_html(filepath)
+        sections_html = extract_production_sections_from_html(filepath, document)
 
         # Step 3: Parse each section
         import tempfile
@@ -753,7 +775,7 @@ def parse_years_arg(value: Optional[str]) -> Optional[List[int]]:
     return years
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Batch processor for researcher full_profile HTMLs",
@@ -779,7 +801,7 @@ def main():
         help="Filtro de anos (ex: 2024,2025) ou 'all' para desativar"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     try:
         allowed_years = parse_years_arg(args.years)
     except ValueError as exc:
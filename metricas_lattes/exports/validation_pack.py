@@ -31,8 +31,7 @@ COLUMN_ORDER = [
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
 
 
 def _safe_text(value: Any) -> str:
@@ -1,15 +1,20 @@
 """Parser for journal articles (Artigos em periódicos)"""
 
+import copy
 import re
 import logging
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from bs4 import BeautifulSoup
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Union
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import ParsedProduction, BaseParser
 
 logger = logging.getLogger(__name__)
 
+# Only article blocks are ever read, so the rest of the page is never built into the tree
+_ARTIGO_STRAINER = SoupStrainer('div', class_='artigo-completo')
+
 
 @dataclass
 class ArtigoProduction(ParsedProduction):
@@ -30,13 +35,33 @@ class ArtigoParser(BaseParser):
     def __init__(self):
         self.errors: List[Dict[str, Any]] = []
     
-    def parse_html(self, html: str) -> List[ArtigoProduction]:
-        """Parse articles from Lattes HTML"""
+    def parse_html(self, html: Union[str, bytes]) -> List[ArtigoProduction]:
+        """Parse articles from Lattes HTML (str, or UTF-8 bytes; other byte encodings raise ValueError)"""
+        if not html or not html.strip():
+            # Nothing to parse; still reset errors from a previous run
+            self.errors = []
+            return []
+        # Bytes go to lxml as UTF-8, as in parse_file, instead of being decoded first
+        encoding = 'utf-8' if isinstance(html, bytes) else None
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding, parse_only=_ARTIGO_STRAINER)
+        self.require_utf8(soup)
+        return self._parse_soup(soup)
+    
+    def parse_file(self, path: Union[str, Path]) -> List[ArtigoProduction]:
+        """Parse articles from a Lattes HTML file, handing the raw bytes to the parser.
+
+        Raises ValueError if the file is not valid UTF-8.
+        """
+        with open(path, 'rb') as f:
+            soup = BeautifulSoup(f, 'lxml', from_encoding='utf-8', parse_only=_ARTIGO_STRAINER)
+        self.require_utf8(soup)
+        return self._parse_soup(soup)
+    
+    def _parse_soup(self, soup: BeautifulSoup) -> List[ArtigoProduction]:
+        """Extract articles from an already parsed document"""
         # Reset errors for each run
         self.errors = []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
         # Find all article blocks
         artigo_divs = soup.find_all('div', class_='artigo-completo')
         
@@ -107,8 +132,8 @@ class ArtigoParser(BaseParser):
         if not transform_span:
             return None
         
-        # Clone and clean
-        clone = BeautifulSoup(str(transform_span), 'html.parser')
+        # Clone and clean (copy the subtree rather than re-parsing its markup)
+        clone = copy.copy(transform_span)
         
         # Remove unwanted elements
         for selector in ['.informacao-artigo', '.icone-producao', 'sup', 'img', '.citado']:
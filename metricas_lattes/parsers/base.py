@@ -2,7 +2,7 @@
 
 import re
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from abc import ABC, abstractmethod
 
 
@@ -29,10 +29,17 @@ class BaseParser(ABC):
     """Abstract base parser for Lattes productions"""
     
     @abstractmethod
-    def parse_html(self, html: str) -> list:
+    def parse_html(self, html: Union[str, bytes]) -> list:
         """Parse Lattes HTML and return structured productions"""
         pass
     
+    @staticmethod
+    def require_utf8(soup) -> None:
+        """Reject byte input that BeautifulSoup could not decode as UTF-8 and had to guess"""
+        # original_encoding is None for str input, 'utf-8' when the declared decode worked
+        if soup.original_encoding not in (None, 'utf-8'):
+            raise ValueError(f"input is not valid UTF-8 (would be decoded as {soup.original_encoding})")
+    
     @staticmethod
     def clean_text(text: str) -> str:
         """Normalize text (whitespace, non-breaking spaces)"""
@@ -3,7 +3,7 @@
 import re
 import logging
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from bs4 import BeautifulSoup
 
 from .base import ParsedProduction, BaseParser
@@ -32,12 +32,17 @@ class CapituloParser(BaseParser):
     def __init__(self):
         self.errors: List[Dict[str, Any]] = []
     
-    def parse_html(self, html: str) -> List[CapituloProduction]:
-        """Parse book chapters from Lattes HTML"""
+    def parse_html(self, html: Union[str, bytes]) -> List[CapituloProduction]:
+        """Parse book chapters from Lattes HTML (str, or UTF-8 bytes; other byte encodings raise ValueError)"""
         # Reset errors for each run
         self.errors = []
+        if not html or not html.strip():
+            return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Bytes go to lxml as UTF-8 instead of being decoded first
+        encoding = 'utf-8' if isinstance(html, bytes) else None
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        self.require_utf8(soup)
         
         # Find all layout-cell-11 elements (chapters use this, not artigo-completo)
         celulas = soup.find_all('div', class_='layout-cell-11')
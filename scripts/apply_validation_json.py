@@ -32,13 +32,14 @@ logger = logging.getLogger(__name__)
 
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # Leitura única do arquivo: json.loads aceita bytes UTF-8 diretamente.
+    return json.loads(path.read_bytes())
 
 
-def save_json(path: Path, data: Any) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def save_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    # Serializa em memória e grava de uma vez (evita muitos write() pequenos).
+    # indent=None gera JSON compacto (saídas consumidas por programas).
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
 
 
 def get_lattes_id_from_validation(data: Dict[str, Any]) -> Optional[str]:
@@ -125,10 +126,9 @@ def apply_validation_to_researcher(
             "applied_at": datetime.now(timezone.utc).isoformat()
         }
         
-        if fp and fp in val_map:
+        val_item = val_map.get(fp) if fp else None
+        if val_item is not None:
             # Match!
-            val_item = val_map[fp]
-            
             # Normaliza campos do schema de validação
             # O schema proposto usa 'pertence_inct', mas o viewer atual pode exportar 'selected'
             pertence = val_item.get("pertence_inct")
@@ -174,9 +174,18 @@ def apply_validation_to_researcher(
         "schema_version": "1.0.0",
         "source_validation_file": validation_file_path.name,
         "processed_at": datetime.now(timezone.utc).isoformat(),
-        "stats": {k: v for k, v in stats.items() if k != "sections"}
+        "stats": {
+            "total_items": stats["total_items"],
+            "matched": stats["matched"],
+            "marked_inct_true": stats["marked_inct_true"],
+            "marked_inct_false": stats["marked_inct_false"],
+            "unmarked": stats["unmarked"],
+        }
     }
     
+    # defaultdict -> dict simples antes de devolver (evita vazar a fábrica lambda)
+    stats["sections"] = dict(stats["sections"])
+    
     return output_data, stats
 
 
@@ -186,6 +195,13 @@ def main():
     parser.add_argument("--researchers-dir", required=True, type=Path, help="Diretório com researcher_output.json originais.")
     parser.add_argument("--validated-output-dir", required=True, type=Path, help="Onde salvar os JSONs enriquecidos.")
     parser.add_argument("--backup-dir", type=Path, help="Se informado, faz backup dos arquivos originais antes de processar.")
+    parser.add_argument(
+        "--compact",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Grava os JSONs enriquecidos sem indentação (padrão). Use --no-compact para indent=2. "
+             "O validation_report.json é sempre indentado."
+    )
     
     args = parser.parse_args()
     
@@ -255,7 +271,7 @@ def main():
             
             # Salva
             out_path = args.validated_output_dir / target_file.name
-            save_json(out_path, new_data)
+            save_json(out_path, new_data, indent=None if args.compact else 2)
             
             # Atualiza stats globais
             global_stats["files_processed"] += 1
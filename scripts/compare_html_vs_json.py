@@ -19,8 +19,8 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-import re
-from dataclasses import dataclass, asdict
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -28,7 +28,8 @@ from metricas_lattes.batch_full_profile import extract_production_sections_from_
 
 
 LOGGER = logging.getLogger(__name__)
-LATTES_ID_RE = re.compile(r"^(?P<id>\d{16})")
+LATTES_ID_LEN = 16
+FULL_PROFILE_SUFFIX = ".full_profile.html"
 
 
 @dataclass
@@ -63,6 +64,20 @@ class SummaryReport:
     problematic_sections: Dict[str, int]
 
 
+def _scan_full_profiles(directory: str) -> Iterable[str]:
+    """Recursively yield paths of *.full_profile.html files using os.scandir.
+
+    Entries are filtered by name before any Path object is created.
+    """
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_full_profiles(entry.path)
+            elif entry.name.endswith(FULL_PROFILE_SUFFIX) and entry.is_file():
+                yield entry.path
+
+
 def iter_html_profiles(html_dir: Path) -> Iterable[Tuple[str, Path]]:
     """Yield (lattes_id, html_path) for each *_full_profile.html under html_dir.
 
@@ -70,14 +85,13 @@ def iter_html_profiles(html_dir: Path) -> Iterable[Tuple[str, Path]]:
     Files without such a prefix are skipped.
     """
 
-    pattern = "*.full_profile.html"
-    for path in sorted(html_dir.rglob(pattern)):
-        match = LATTES_ID_RE.match(path.name)
-        if not match:
-            LOGGER.debug("Skipping HTML without 16-digit prefix: %s", path)
+    for path_str in sorted(_scan_full_profiles(str(html_dir))):
+        name = os.path.basename(path_str)
+        lattes_id = name[:LATTES_ID_LEN]
+        if len(lattes_id) != LATTES_ID_LEN or not lattes_id.isdigit():
+            LOGGER.debug("Skipping HTML without 16-digit prefix: %s", path_str)
             continue
-        lattes_id = match.group("id")
-        yield lattes_id, path
+        yield lattes_id, Path(path_str)
 
 
 def find_json_for_lattes_id(json_batch_dir: Path, lattes_id: str) -> Optional[Path]:
@@ -160,7 +174,17 @@ def derive_json_section_counts(json_data: Dict) -> Dict[str, int]:
 def compare_sections(
     html_sections: Dict[str, Dict], json_counts: Dict[str, int]
 ) -> List[SectionComparison]:
-    """Compare item counts between HTML sections and JSON-derived sections."""
+    """Compare item counts between HTML sections and JSON-derived sections.
+
+    When every section matches, an empty list is returned (the caller treats
+    it as "ok"), so no per-section comparison objects are allocated.
+    """
+
+    if html_sections.keys() == json_counts.keys() and all(
+        int(html_sections[name].get("item_count", 0)) == int(count)
+        for name, count in json_counts.items()
+    ):
+        return []
 
     section_names = set(html_sections.keys()) | set(json_counts.keys())
     comparisons: List[SectionComparison] = []
@@ -209,8 +233,7 @@ def build_researcher_report(
             status="missing_pair",
         )
 
-    with json_path.open("r", encoding="utf-8") as f:
-        json_data = json.load(f)
+    json_data = json.loads(json_path.read_bytes())
 
     json_counts = derive_json_section_counts(json_data)
     comparisons = compare_sections(html_sections, json_counts)
@@ -231,6 +254,14 @@ def build_researcher_report(
     )
 
 
+def _report_to_dict(report: ResearcherReport) -> Dict:
+    """Shallow dict view of a report (fields are primitives, no deep copy needed)."""
+
+    data = dict(vars(report))
+    data["sections"] = [vars(section) for section in report.sections]
+    return data
+
+
 def write_researcher_report(out_dir: Path, report: ResearcherReport) -> None:
     """Write the per-researcher diagnostic JSON.
 
@@ -239,16 +270,18 @@ def write_researcher_report(out_dir: Path, report: ResearcherReport) -> None:
 
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{report.lattes_id}__diagnostic.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(asdict(report), f, ensure_ascii=False, indent=2)
+    out_path.write_text(
+        json.dumps(_report_to_dict(report), ensure_ascii=False, indent=2), encoding="utf-8"
+    )
     LOGGER.debug("Wrote report for %s to %s", report.lattes_id, out_path)
 
 
 def write_summary(out_dir: Path, summary: SummaryReport) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "summary.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(asdict(summary), f, ensure_ascii=False, indent=2)
+    out_path.write_text(
+        json.dumps(vars(summary), ensure_ascii=False, indent=2), encoding="utf-8"
+    )
     LOGGER.info("Wrote summary to %s", out_path)
 
 
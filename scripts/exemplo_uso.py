@@ -7,14 +7,27 @@ Demonstra como usar os parsers para extrair dados de fixtures Lattes.
 
 import sys
 import json
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).parent.parent
+FIXTURES_DIR = ROOT_DIR / 'tests' / 'fixtures' / 'lattes'
+OUTPUTS_DIR = ROOT_DIR / 'outputs'
+
 # Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT_DIR))
 
 from metricas_lattes.parser_router import parse_fixture
 
 
+@lru_cache(maxsize=32)
+def _parse_cached(path_str: str) -> dict:
+    """Parse um fixture uma única vez (os exemplos apenas leem o resultado)"""
+    return parse_fixture(Path(path_str))
+
+
 def exemplo_basico():
     """Exemplo básico: parse um único arquivo"""
     print("="*80)
@@ -22,10 +35,10 @@ def exemplo_basico():
     print("="*80)
 
     # Caminho para um fixture
-    fixture_path = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes' / 'Artigos aceitos para publicação.html'
+    fixture_path = FIXTURES_DIR / 'Artigos aceitos para publicação.html'
 
     # Parse o arquivo
-    result = parse_fixture(fixture_path)
+    result = _parse_cached(str(fixture_path))
 
     # Mostrar informações básicas
     print(f"\nTipo de produção: {result['tipo_producao']}")
@@ -49,7 +62,7 @@ def exemplo_processamento_em_lote():
     print("EXEMPLO 2: Processamento em lote")
     print("="*80)
 
-    fixtures_dir = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes'
+    fixtures_dir = FIXTURES_DIR
 
     # Lista de tipos específicos para processar
     tipos_interesse = [
@@ -65,16 +78,20 @@ def exemplo_processamento_em_lote():
         if not fixture_path.exists():
             continue
 
-        result = parse_fixture(fixture_path)
+        result = _parse_cached(str(fixture_path))
         num_items = len(result['items'])
         total_items += num_items
 
         print(f"\n{tipo}")
         print(f"  Items extraídos: {num_items}")
 
-        # Estatísticas
-        items_com_doi = sum(1 for item in result['items'] if item.get('doi'))
-        items_com_titulo = sum(1 for item in result['items'] if item.get('titulo'))
+        # Estatísticas (uma única passada pelos items)
+        items_com_doi = items_com_titulo = 0
+        for item in result['items']:
+            if item.get('doi'):
+                items_com_doi += 1
+            if item.get('titulo'):
+                items_com_titulo += 1
 
         print(f"  Com DOI: {items_com_doi}")
         print(f"  Com título: {items_com_titulo}")
@@ -89,22 +106,23 @@ def exemplo_filtragem():
     print("EXEMPLO 3: Filtragem de dados")
     print("="*80)
 
-    fixture_path = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes' / 'Artigos completos publicados em periódicos.html'
+    fixture_path = FIXTURES_DIR / 'Artigos completos publicados em periódicos.html'
 
-    result = parse_fixture(fixture_path)
+    result = _parse_cached(str(fixture_path))
+    items = result['items']
 
     # Filtrar: artigos de 2024 ou posterior
     artigos_recentes = [
-        item for item in result['items']
-        if item.get('ano') and item['ano'] >= 2024
+        item for item in items
+        if (ano := item.get('ano')) and ano >= 2024
     ]
 
-    print(f"\nTotal de artigos: {len(result['items'])}")
+    print(f"\nTotal de artigos: {len(items)}")
     print(f"Artigos de 2024+: {len(artigos_recentes)}")
 
     # Mostrar alguns
     print(f"\nPrimeiros 3 artigos recentes:")
-    for item in artigos_recentes[:3]:
+    for item in islice(artigos_recentes, 3):
         print(f"\n  [{item.get('ano')}] {item.get('titulo', 'Sem título')[:60]}...")
         if item.get('veiculo'):
             print(f"     Em: {item['veiculo']}")
@@ -117,18 +135,17 @@ def exemplo_exportacao():
     print("EXEMPLO 4: Exportação para JSON")
     print("="*80)
 
-    fixture_path = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes' / 'Capítulos de livros publicados.html'
+    fixture_path = FIXTURES_DIR / 'Capítulos de livros publicados.html'
 
-    result = parse_fixture(fixture_path)
+    result = _parse_cached(str(fixture_path))
 
     # Criar diretório de output
-    output_dir = Path(__file__).parent.parent / 'outputs'
+    output_dir = OUTPUTS_DIR
     output_dir.mkdir(exist_ok=True)
 
     # Salvar resultado completo
     output_path = output_dir / 'capitulos_parsed.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    output_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
 
     print(f"\nResultado salvo em: {output_path}")
     print(f"Total de capítulos: {len(result['items'])}")
@@ -145,8 +162,7 @@ def exemplo_exportacao():
         })
 
     simplified_path = output_dir / 'capitulos_simplificado.json'
-    with open(simplified_path, 'w', encoding='utf-8') as f:
-        json.dump(simplified, f, indent=2, ensure_ascii=False)
+    simplified_path.write_text(json.dumps(simplified, indent=2, ensure_ascii=False), encoding='utf-8')
 
     print(f"Versão simplificada salva em: {simplified_path}")
 
@@ -158,16 +174,13 @@ def exemplo_agregacao():
     print("EXEMPLO 5: Agregação e estatísticas")
     print("="*80)
 
-    fixture_path = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes' / 'Artigos completos publicados em periódicos.html'
+    fixture_path = FIXTURES_DIR / 'Artigos completos publicados em periódicos.html'
 
-    result = parse_fixture(fixture_path)
+    result = _parse_cached(str(fixture_path))
+    items = result['items']
 
     # Contar por ano
-    por_ano = {}
-    for item in result['items']:
-        ano = item.get('ano')
-        if ano:
-            por_ano[ano] = por_ano.get(ano, 0) + 1
+    por_ano = Counter(ano for item in items if (ano := item.get('ano')))
 
     # Ordenar por ano
     anos_ordenados = sorted(por_ano.items(), reverse=True)
@@ -179,10 +192,14 @@ def exemplo_agregacao():
     for ano, count in anos_ordenados[:10]:  # Top 10
         print(f"{ano:<10} {count:>10}")
 
-    # Estatísticas
-    total = len(result['items'])
-    com_doi = sum(1 for item in result['items'] if item.get('doi'))
-    com_volume = sum(1 for item in result['items'] if item.get('volume'))
+    # Estatísticas (uma única passada pelos items)
+    total = len(items)
+    com_doi = com_volume = 0
+    for item in items:
+        if item.get('doi'):
+            com_doi += 1
+        if item.get('volume'):
+            com_volume += 1
 
     print(f"\nEstatísticas:")
     print(f"  Total: {total}")
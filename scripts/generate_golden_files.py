@@ -9,13 +9,20 @@ Usage:
     python3 scripts/generate_golden_files.py [--limit N]
 """
 
+import os
 import sys
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).parent.parent
+FIXTURES_DIR = ROOT_DIR / 'tests' / 'fixtures' / 'lattes'
+EXPECTED_DIR = ROOT_DIR / 'tests' / 'fixtures' / 'expected'
+
 # Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT_DIR))
 
 from metricas_lattes.parser_router import parse_fixture
 
@@ -32,13 +39,20 @@ def generate_golden_file(fixture_path: Path, output_dir: Path, overwrite: bool =
     result = parse_fixture(fixture_path)
 
     # Write golden file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    output_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
 
     print(f"  ✓ Generated: {output_path.name} ({len(result['items'])} items)")
     return True
 
 
+def _gen_worker(fixture_path: Path, output_dir: Path, overwrite: bool):
+    """Process-pool worker: returns (fixture name, generated?, error message)"""
+    try:
+        return fixture_path.name, generate_golden_file(fixture_path, output_dir, overwrite), None
+    except Exception as e:
+        return fixture_path.name, False, str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate golden files for parser tests')
     parser.add_argument('--limit', type=int, help='Limit number of files to process')
@@ -47,8 +61,8 @@ def main():
     args = parser.parse_args()
 
     # Setup paths
-    fixtures_dir = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes'
-    output_dir = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'expected'
+    fixtures_dir = FIXTURES_DIR
+    output_dir = EXPECTED_DIR
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -58,10 +72,14 @@ def main():
     print()
 
     # Get fixtures
-    fixtures = [
-        f for f in sorted(fixtures_dir.glob('*.html'))
-        if 'full_profile' not in str(f)
-    ]
+    with os.scandir(fixtures_dir) as entries:
+        fixtures = sorted(
+            Path(e.path) for e in entries
+            if e.name.endswith('.html')
+            and 'full_profile' not in e.name
+            and not e.name.startswith('._')
+            and e.is_file()
+        )
 
     if args.only:
         fixtures = [f for f in fixtures if args.only.lower() in f.name.lower()]
@@ -77,14 +95,16 @@ def main():
     generated = 0
     skipped = 0
 
-    for fixture_path in fixtures:
-        try:
-            if generate_golden_file(fixture_path, output_dir, args.overwrite):
+    # Parsing is CPU-bound and independent per fixture: spread across processes
+    worker = partial(_gen_worker, output_dir=output_dir, overwrite=args.overwrite)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for name, ok, error in executor.map(worker, fixtures, chunksize=4):
+            if error is not None:
+                print(f"  ✗ Failed: {name}: {error}")
+            elif ok:
                 generated += 1
             else:
                 skipped += 1
-        except Exception as e:
-            print(f"  ✗ Failed: {fixture_path.name}: {e}")
 
     # Summary
     print()
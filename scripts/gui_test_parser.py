@@ -9,17 +9,32 @@ Interface gráfica simples usando tkinter (stdlib) para:
 - Exportar JSON
 """
 
+import os
 import sys
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 
+ROOT_DIR = Path(__file__).parent.parent
+SCHEMA_PATH = ROOT_DIR / 'schema' / 'producoes.schema.json'
+
 # Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT_DIR))
+
+from metricas_lattes.parser_router import parse_fixture, normalize_filename, PARSER_REGISTRY
 
-from metricas_lattes.parser_router import parse_fixture, PARSER_REGISTRY
+# Same filenames are re-run often from the GUI; normalization is pure
+_normalize_filename = lru_cache(maxsize=256)(normalize_filename)
+
+# Only the first few errors are shown; stop collecting beyond this
+VALIDATION_ERROR_LIMIT = 20
 
 
 class ParserGUI:
@@ -32,10 +47,21 @@ class ParserGUI:
 
         self.selected_files = []
         self.schema = None
+        self.validator = None
         self.results = []
+        self._log_queue = []
+
+        # Parsing runs in worker threads; Tk is only touched from the main loop
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.pending = deque()
+        self.total_files = 0
+
+        # Registry patterns, longest (most specific) first
+        self._patterns = sorted(PARSER_REGISTRY.items(), key=lambda kv: -len(kv[0]))
 
         self.setup_ui()
         self.load_schema()
+        self.root.after(100, self._flush_log)
 
     def setup_ui(self):
         """Setup interface"""
@@ -64,6 +90,10 @@ class ParserGUI:
         ttk.Checkbutton(options_frame, text="Salvar JSON ao lado do HTML",
                        variable=self.save_json_var).pack(side=tk.LEFT, padx=20)
 
+        self.pretty_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="JSON indentado",
+                       variable=self.pretty_var).pack(side=tk.LEFT)
+
         # Run button
         button_frame = ttk.Frame(self.root, padding="10")
         button_frame.pack(fill=tk.X)
@@ -102,14 +132,29 @@ class ParserGUI:
 
     def load_schema(self):
         """Load JSON Schema"""
-        schema_path = Path(__file__).parent.parent / 'schema' / 'producoes.schema.json'
+        schema_path = SCHEMA_PATH
         try:
             with open(schema_path, 'r', encoding='utf-8') as f:
                 self.schema = json.load(f)
+            self.validator = self.build_validator(self.schema)
             self.log(f"✓ Schema carregado: {schema_path.name}\n")
         except Exception as e:
             self.log(f"✗ Erro ao carregar schema: {e}\n")
             self.schema = None
+            self.validator = None
+
+    @staticmethod
+    def build_validator(schema: dict):
+        """Compile the schema validator once (None if jsonschema is missing)"""
+        try:
+            from jsonschema import Draft7Validator
+        except ImportError:
+            try:
+                from jsonschema import Draft202012Validator as Draft7Validator
+            except ImportError:
+                return None
+
+        return Draft7Validator(schema)
 
     def select_files(self):
         """Select HTML files"""
@@ -150,15 +195,32 @@ class ParserGUI:
         self.log(f"Data/hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         self.log(f"{'='*60}\n\n")
 
-        for idx, filepath in enumerate(self.selected_files, 1):
-            self.status_var.set(f"Processando {idx}/{len(self.selected_files)}: {filepath.name}")
-            self.root.update()
+        self.total_files = len(self.selected_files)
+        self.pending = deque(
+            (filepath, self.executor.submit(parse_fixture, filepath))
+            for filepath in self.selected_files
+        )
+        self.root.after(100, self._poll_results)
+
+    def _poll_results(self):
+        """Consume finished parses in submission order (runs on the Tk thread)"""
+        while self.pending and self.pending[0][1].done():
+            filepath, future = self.pending.popleft()
+            idx = self.total_files - len(self.pending)
+            self.status_var.set(f"Processando {idx}/{self.total_files}: {filepath.name}")
 
             try:
-                self.process_file(filepath)
+                self.process_file(filepath, future)
             except Exception as e:
                 self.log(f"✗ ERRO FATAL em {filepath.name}: {e}\n\n")
 
+        if self.pending:
+            self.root.after(100, self._poll_results)
+        else:
+            self._finish_parsing()
+
+    def _finish_parsing(self):
+        """Restore UI state once every file has been processed"""
         self.progress.stop()
         self.run_button.config(state=tk.NORMAL)
         self.export_button.config(state=tk.NORMAL)
@@ -169,14 +231,14 @@ class ParserGUI:
         self.log(f"Total processado: {len(self.results)}\n")
         self.log(f"{'='*60}\n")
 
-    def process_file(self, filepath: Path):
-        """Process a single file"""
+    def process_file(self, filepath: Path, future=None):
+        """Process a single file (optionally using a parse already running in the pool)"""
         self.log(f"{'─'*60}\n")
         self.log(f"Arquivo: {filepath.name}\n")
 
         # Parse
         try:
-            result = parse_fixture(filepath)
+            result = future.result() if future is not None else parse_fixture(filepath)
         except Exception as e:
             self.log(f"✗ Erro ao parsear: {e}\n\n")
             return
@@ -188,13 +250,18 @@ class ParserGUI:
 
         # Validate schema
         if self.validate_schema_var.get() and self.schema:
-            errors = self.validate_result(result)
+            # One error past the limit tells "exactly 20" apart from "more than 20"
+            errors = self.validate_result(result, limit=VALIDATION_ERROR_LIMIT + 1)
             if errors:
-                self.log(f"✗ Validação de schema: {len(errors)} erro(s)\n")
+                capped = len(errors) > VALIDATION_ERROR_LIMIT
+                errors = errors[:VALIDATION_ERROR_LIMIT]
+                count = f"{len(errors)}+" if capped else str(len(errors))
+                self.log(f"✗ Validação de schema: {count} erro(s)\n")
                 for error in errors[:5]:  # Show first 5
                     self.log(f"  - {error}\n")
                 if len(errors) > 5:
-                    self.log(f"  ... e mais {len(errors) - 5} erro(s)\n")
+                    rest = f"{len(errors) - 5}+" if capped else str(len(errors) - 5)
+                    self.log(f"  ... e mais {rest} erro(s)\n")
             else:
                 self.log(f"✓ Validação de schema: OK\n")
         else:
@@ -204,8 +271,7 @@ class ParserGUI:
         if self.save_json_var.get():
             output_path = filepath.with_suffix('.parsed.json')
             try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                output_path.write_text(json.dumps(result, **self.json_options()), encoding='utf-8')
                 self.log(f"✓ JSON salvo: {output_path.name}\n")
             except Exception as e:
                 self.log(f"✗ Erro ao salvar JSON: {e}\n")
@@ -221,30 +287,28 @@ class ParserGUI:
 
     def guess_parser_type(self, filepath: Path) -> str:
         """Guess which parser was used"""
-        from metricas_lattes.parser_router import normalize_filename
+        normalized = _normalize_filename(filepath.name)
 
-        normalized = normalize_filename(filepath.name)
-
-        for pattern in PARSER_REGISTRY.keys():
+        for pattern, parser_class in self._patterns:
             if pattern in normalized:
-                return f"{PARSER_REGISTRY[pattern].__name__} (specific)"
+                return f"{parser_class.__name__} (specific)"
 
         return "GenericParser (fallback)"
 
-    def validate_result(self, data: dict) -> list:
-        """Validate result against schema"""
-        try:
-            from jsonschema import Draft7Validator
-        except ImportError:
-            try:
-                from jsonschema import Draft202012Validator as Draft7Validator
-            except ImportError:
-                return ["jsonschema não instalado"]
+    def json_options(self) -> dict:
+        """json.dump(s) options: indented or compact, per the GUI checkbox"""
+        if self.pretty_var.get():
+            return {'indent': 2, 'ensure_ascii': False}
+        return {'separators': (',', ':'), 'ensure_ascii': False}
+
+    def validate_result(self, data: dict, limit: Optional[int] = None) -> list:
+        """Validate result against schema (stops after `limit` errors, if given)"""
+        if self.validator is None:
+            return ["jsonschema não instalado"]
 
-        validator = Draft7Validator(self.schema)
         errors = []
 
-        for error in validator.iter_errors(data):
+        for error in islice(self.validator.iter_errors(data), limit):
             path = '.'.join(str(p) for p in error.path) if error.path else 'root'
             errors.append(f"{path}: {error.message}")
 
@@ -275,8 +339,10 @@ class ParserGUI:
                 'results': self.results
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(consolidated, f, indent=2, ensure_ascii=False)
+            # json.dump already encodes incrementally (iterencode); a large
+            # buffer batches its many small chunks into few write() calls
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(consolidated, f, **self.json_options())
 
             self.log(f"\n✓ JSON consolidado salvo: {Path(output_path).name}\n")
             messagebox.showinfo("Sucesso", f"JSON consolidado salvo:\n{output_path}")
@@ -287,13 +353,20 @@ class ParserGUI:
 
     def clear_log(self):
         """Clear log"""
+        self._log_queue.clear()
         self.log_text.delete(1.0, tk.END)
 
     def log(self, message: str):
-        """Add message to log"""
-        self.log_text.insert(tk.END, message)
-        self.log_text.see(tk.END)
-        self.root.update()
+        """Add message to log (flushed to the widget in batches)"""
+        self._log_queue.append(message)
+
+    def _flush_log(self):
+        """Write queued log messages with a single insert, then reschedule"""
+        if self._log_queue:
+            self.log_text.insert(tk.END, ''.join(self._log_queue))
+            self.log_text.see(tk.END)
+            self._log_queue.clear()
+        self.root.after(100, self._flush_log)
 
 
 def main():
@@ -301,6 +374,7 @@ def main():
     root = tk.Tk()
     app = ParserGUI(root)
     root.mainloop()
+    app.executor.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == '__main__':
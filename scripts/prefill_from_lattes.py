@@ -2,18 +2,22 @@
 """CLI for generating prefill JSON from Lattes HTML"""
 
 import argparse
+import itertools
 import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).parent.parent
+PREFILL_DIR = ROOT_DIR / "docs" / "prefill"
+
 # Temporary: add parent to path until proper packaging/install
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT_DIR))
 
 from metricas_lattes.parsers.artigos import ArtigoParser
 
 
-def parse_args():
+def parse_args(argv=None):
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description="Generate prefill JSON from Lattes HTML (articles only)",
@@ -35,8 +39,19 @@ def parse_args():
         required=True,
         help='Researcher slug (used for output filename)'
     )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        default=PREFILL_DIR,
+        help='Directory for the prefill JSONs (default: docs/prefill)'
+    )
+    parser.add_argument(
+        '--jsonl',
+        action='store_true',
+        help='Write profile and errors as two records of a single <slug>.jsonl file'
+    )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def sort_producoes(producoes):
@@ -49,9 +64,78 @@ def sort_producoes(producoes):
     return sorted(producoes, key=sort_key)
 
 
-def main():
+def split_around_artigos(record, indent):
+    """Encode `record` with a placeholder for producoes.artigos; returns (head, tail).
+
+    The placeholder is renumbered until it occurs exactly once in the
+    encoded text, so no value in `record` can be mistaken for it.
+    """
+    for n in itertools.count():
+        marker = f"__artigos_{n}__"
+        scaffold = dict(record, producoes=dict(record["producoes"], artigos=marker))
+        text = json.dumps(scaffold, indent=indent, ensure_ascii=False)
+        placeholder = json.dumps(marker)
+        if text.count(placeholder) == 1:
+            head, tail = text.split(placeholder)
+            return head, tail
+
+
+def write_streamed_record(f, record, artigos, indent):
+    """Write `record` to `f` with producoes.artigos encoded one article at a time.
+
+    The text is identical to json.dumps(record, indent=indent,
+    ensure_ascii=False) with the articles in place.
+    """
+    head, tail = split_around_artigos(record, indent)
+    if indent is None:
+        item_prefix, item_sep, close = "", ", ", "]"
+    else:
+        # Articles sit three levels deep: object -> "producoes" -> "artigos" array
+        item_prefix = "\n" + " " * (3 * indent)
+        item_sep = ","
+        close = "\n" + " " * (2 * indent) + "]"
+
+    f.write(head)
+    f.write("[")
+    first = True
+    for artigo in artigos:
+        encoded = json.dumps(artigo, indent=indent, ensure_ascii=False)
+        if indent is not None:
+            encoded = encoded.replace("\n", item_prefix)
+        f.write(item_prefix if first else item_sep + item_prefix)
+        f.write(encoded)
+        first = False
+    f.write("]" if first else close)
+    f.write(tail)
+
+
+def write_prefill_json(output_file, output_data, artigos):
+    """Write the prefill JSON, encoding one article at a time.
+
+    `output_data["producoes"]["artigos"]` is filled from the `artigos` iterable
+    (dicts), so the full list of converted articles is never held in memory.
+    The text is identical to json.dumps(..., indent=2, ensure_ascii=False).
+    """
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_streamed_record(f, output_data, artigos, indent=2)
+
+
+def write_prefill_jsonl(output_file, output_data, artigos, errors_data):
+    """Write the profile and its errors as two JSON Lines records in one file.
+
+    The first line is {"kind": "profile", ...} with the articles streamed in
+    as in write_prefill_json; the second is {"kind": "errors", ...}.
+    """
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_streamed_record(f, {"kind": "profile", **output_data}, artigos, indent=None)
+        f.write("\n")
+        f.write(json.dumps({"kind": "errors", **errors_data}, ensure_ascii=False))
+        f.write("\n")
+
+
+def main(argv=None):
     """Main CLI entry point"""
-    args = parse_args()
+    args = parse_args(argv)
 
     # Check for conflicting input arguments
     if args.input_file and args.input_file_alt:
@@ -71,17 +155,15 @@ def main():
         print(f"Error: input file not found: {input_path}", file=sys.stderr)
         sys.exit(2)
 
-    # Read HTML
+    # Read and parse articles straight from the file bytes
+    parser = ArtigoParser()
+    # Non-UTF-8 input raises ValueError and exits 2, same as an unreadable file
     try:
-        html_content = input_path.read_text(encoding='utf-8')
-    except Exception as e:
+        articles = parser.parse_file(input_path)
+    except (OSError, ValueError) as e:
         print(f"Error: failed to read input file: {e}", file=sys.stderr)
         sys.exit(2)
 
-    # Parse articles
-    parser = ArtigoParser()
-    articles = parser.parse_html(html_content)
-
     # Sort deterministically
     articles_sorted = sort_producoes(articles)
 
@@ -90,32 +172,35 @@ def main():
         "pesquisador": args.pesquisador,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "source_html": input_path.name,
-        "producoes": {
-            "artigos": [art.to_dict(include_trace=True) for art in articles_sorted]
-        },
+        "producoes": {},
         "counts": {
             "artigos": len(articles_sorted)
         }
     }
 
     # Create output directory
-    output_dir = Path(__file__).parent.parent / "docs" / "prefill"
+    output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write main JSON
-    output_file = output_dir / f"{args.pesquisador}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
-
-    # Write errors JSON
-    errors_file = output_dir / f"{args.pesquisador}.errors.json"
     errors_data = {
         "pesquisador": args.pesquisador,
         "source_html": input_path.name,
         "errors": parser.errors
     }
-    with open(errors_file, 'w', encoding='utf-8') as f:
-        json.dump(errors_data, f, indent=2, ensure_ascii=False)
+    artigos = (art.to_dict(include_trace=True) for art in articles_sorted)
+
+    if args.jsonl:
+        # Single file: profile record, then errors record
+        output_file = errors_file = output_dir / f"{args.pesquisador}.jsonl"
+        write_prefill_jsonl(output_file, output_data, artigos, errors_data)
+    else:
+        # Write main JSON
+        output_file = output_dir / f"{args.pesquisador}.json"
+        write_prefill_json(output_file, output_data, artigos)
+
+        # Write errors JSON
+        errors_file = output_dir / f"{args.pesquisador}.errors.json"
+        errors_file.write_text(json.dumps(errors_data, indent=2, ensure_ascii=False), encoding='utf-8')
 
     # Print summary
     print(f"✓ Parsed {len(articles_sorted)} article(s)")
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import tempfile
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Any, Dict, List
@@ -29,6 +31,11 @@ from metricas_lattes.batch_full_profile import (
 )
 
 
+def _production_type_of(item: Dict[str, Any]) -> str:
+    src = item.get("source") or {}
+    return src.get("production_type") or item.get("production_type") or "<sem_tipo>"
+
+
 def scan_directory(html_dir: Path) -> Dict[str, Any]:
     """Percorre todos os HTMLs em `html_dir` e gera estatísticas.
 
@@ -38,25 +45,28 @@ def scan_directory(html_dir: Path) -> Dict[str, Any]:
     - por_tipo: {production_type: {"total": int, "sem_ano": int}}
     """
 
-    html_files = sorted(
-        [p for p in html_dir.iterdir() if p.suffix.lower() == ".html"]
-    )
+    with os.scandir(html_dir) as entries:
+        html_files = sorted(
+            Path(e.path)
+            for e in entries
+            if e.name.lower().endswith(".html") and not e.name.startswith("._") and e.is_file()
+        )
 
     total_items = 0
     total_sem_ano = 0
     por_tipo_total: Counter[str] = Counter()
     por_tipo_sem_ano: Counter[str] = Counter()
 
-    for html_path in html_files:
-        print(f"Processando {html_path.name}...")
+    # Uma única pasta temporária para todo o diretório: parse_section_html
+    # grava e remove o próprio arquivo temporário a cada seção.
+    with tempfile.TemporaryDirectory(prefix="metricas_diag_") as temp_dir_str:
+        temp_dir = Path(temp_dir_str)
 
-        sections_html = extract_production_sections_from_html(html_path)
+        for html_path in html_files:
+            print(f"Processando {html_path.name}...")
 
-        # Usamos uma pasta temporária por arquivo, como em batch_full_profile
-        import tempfile
+            sections_html = extract_production_sections_from_html(html_path)
 
-        temp_dir = Path(tempfile.mkdtemp(prefix="metricas_diag_"))
-        try:
             all_items: List[Dict[str, Any]] = []
 
             for section in sections_html:
@@ -77,40 +87,33 @@ def scan_directory(html_dir: Path) -> Dict[str, Any]:
                 )
 
                 all_items.extend(items_with_provenance)
-        finally:
-            if temp_dir.exists():
-                import shutil
 
-                shutil.rmtree(temp_dir)
+            # Aplicar os mesmos fallbacks de citação antes de tentar inferir ano
+            _apply_citacao_fallbacks(all_items)
 
-        # Aplicar os mesmos fallbacks de citação antes de tentar inferir ano
-        _apply_citacao_fallbacks(all_items)
+            types_all = [_production_type_of(item) for item in all_items]
+            types_missing = [
+                prod_type
+                for prod_type, item in zip(types_all, all_items)
+                if _infer_year_from_item(item) is None
+            ]
 
-        for item in all_items:
-            total_items += 1
-
-            src = item.get("source") or {}
-            prod_type = src.get("production_type") or item.get("production_type") or "<sem_tipo>"
-
-            por_tipo_total[prod_type] += 1
-
-            year = _infer_year_from_item(item)
-            if year is None:
-                total_sem_ano += 1
-                por_tipo_sem_ano[prod_type] += 1
+            por_tipo_total.update(types_all)
+            por_tipo_sem_ano.update(types_missing)
+            total_items += len(types_all)
+            total_sem_ano += len(types_missing)
 
     # Montar estrutura final
-    por_tipo: Dict[str, Dict[str, int]] = {}
-    for tipo in sorted(por_tipo_total.keys() | por_tipo_sem_ano.keys()):
-        por_tipo[tipo] = {
-            "total": int(por_tipo_total.get(tipo, 0)),
-            "sem_ano": int(por_tipo_sem_ano.get(tipo, 0)),
-        }
+    # Counter devolve 0 para chaves ausentes
+    por_tipo: Dict[str, Dict[str, int]] = {
+        tipo: {"total": por_tipo_total[tipo], "sem_ano": por_tipo_sem_ano[tipo]}
+        for tipo in sorted(por_tipo_total.keys() | por_tipo_sem_ano.keys())
+    }
 
     return {
         "html_dir": str(html_dir),
-        "total_items": int(total_items),
-        "total_sem_ano": int(total_sem_ano),
+        "total_items": total_items,
+        "total_sem_ano": total_sem_ano,
         "por_tipo": por_tipo,
     }
 
@@ -7,33 +7,45 @@ smallest, median, and largest.
 from __future__ import annotations
 
 import argparse
+import heapq
+import os
 import shutil
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import List
 
 
 def select_diverse_profiles(input_dir: Path, count: int = 3) -> List[Path]:
-    html_files = [
-        path
-        for path in input_dir.glob("*.html")
-        if path.is_file() and not path.name.startswith("._")
-    ]
+    # One directory scan: DirEntry caches type info and stat results
+    with os.scandir(input_dir) as entries:
+        html_files = [
+            (entry.name, entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith(".html")
+            and not entry.name.startswith("._")
+            and entry.is_file()
+        ]
     if not html_files:
         return []
 
-    html_files.sort(key=lambda path: path.stat().st_size)
-    indices = [0, len(html_files) // 2, len(html_files) - 1]
+    # Only the smallest, median and largest are needed: min/max are single
+    # passes and the median comes from a bounded heap (same picks as a stable
+    # sort by size)
+    by_size = itemgetter(1)
+    median_index = len(html_files) // 2
+    candidates = [
+        min(html_files, key=by_size),
+        heapq.nsmallest(median_index + 1, html_files, key=by_size)[-1],
+        max(reversed(html_files), key=by_size),
+    ]
     selected = []
     seen = set()
-    for index in indices:
-        if index < 0 or index >= len(html_files):
-            continue
-        candidate = html_files[index]
-        if candidate in seen:
+    for name, _size in candidates:
+        if name in seen:
             continue
-        selected.append(candidate)
-        seen.add(candidate)
+        selected.append(input_dir / name)
+        seen.add(name)
         if len(selected) >= count:
             break
     return selected
@@ -60,6 +72,11 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Output directory for copies (default: outputs/_sample_full_profiles/<timestamp>/)",
     )
+    parser.add_argument(
+        "--preserve-metadata",
+        action="store_true",
+        help="Keep mtime/permissions of the copied HTMLs (slower)",
+    )
     return parser.parse_args()
 
 
@@ -82,8 +99,10 @@ def main() -> int:
             stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             output_dir = Path("outputs") / "_sample_full_profiles" / stamp
         output_dir.mkdir(parents=True, exist_ok=True)
+        # Sample copies only need the content; copyfile lets the kernel move the bytes
+        copy = shutil.copy2 if args.preserve_metadata else shutil.copyfile
         for path in selected:
-            shutil.copy2(path, output_dir / path.name)
+            copy(path, output_dir / path.name)
         print(str(output_dir))
     else:
         for path in selected:
@@ -1,6 +1,7 @@
 import json
 import subprocess
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Paths
@@ -9,30 +10,36 @@ MAILER_PATH = Path(os.path.expanduser("~/.openclaw/workspace-main/scripts/gmail_
 ENV_PATH = Path(os.path.expanduser("~/.openclaw/secrets/gmail.env"))
 
 def load_researchers():
-    with open(MANIFEST_PATH, "r") as f:
-        data = json.load(f)
+    # Reaproveita o parse enquanto o manifest não mudar (mtime/tamanho)
+    st = MANIFEST_PATH.stat()
+    return list(_load_researchers_cached(str(MANIFEST_PATH), st.st_mtime_ns, st.st_size))
+
+@lru_cache(maxsize=4)
+def _load_researchers_cached(path, mtime_ns, size):
+    data = json.loads(Path(path).read_bytes())
     
-    researchers = []
+    pairs = []
     for lattes_id, filename in data.get("by_lattes_id", {}).items():
         # Filename format: id__slug-name.json
-        parts = filename.replace(".json", "").split("__")
-        if len(parts) > 1:
-            slug = parts[1]
-            name = slug.replace("-", " ").title()
+        _, sep, slug = filename.removesuffix(".json").partition("__")
+        if sep:
             # Fix specific capitalizations if needed, but title case is usually ok
-            researchers.append({"name": name, "id": lattes_id})
+            pairs.append((slug.replace("-", " ").title(), lattes_id))
     
-    # Sort by name
-    researchers.sort(key=lambda x: x["name"])
-    return researchers
+    # Sort by name (tuple order, no key callback)
+    pairs.sort()
+    researchers = [{"name": name, "id": lattes_id} for name, lattes_id in pairs]
+    return tuple(researchers)
+
+VALIDATION_URL_PREFIX = "https://inctnanoagro.github.io/metricas/validacao/?prefill="
+
+def researcher_item_html(r):
+    url = VALIDATION_URL_PREFIX + r["id"]
+    # Exibe o link explícito para facilitar cópia
+    return f"<li><strong>{r['name']}</strong>:<br><a href='{url}'>{url}</a></li>"
 
 def generate_html(researchers):
-    list_html = "<ul>"
-    for r in researchers:
-        url = f"https://inctnanoagro.github.io/metricas/validacao/?prefill={r['id']}"
-        # Exibe o link explícito para facilitar cópia
-        list_html += f"<li><strong>{r['name']}</strong>:<br><a href='{url}'>{url}</a></li>"
-    list_html += "</ul>"
+    list_html = "<ul>" + "".join(researcher_item_html(r) for r in researchers) + "</ul>"
 
     return f"""
     <html>
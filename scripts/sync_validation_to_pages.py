@@ -5,20 +5,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
+_LATTES_ID_RE = re.compile(r'([0-9]{16})__')
+
 
 def extract_lattes_id(filename: str) -> Optional[str]:
     """Extract 16-digit lattes_id from <id>__*.json filenames."""
-    base = Path(filename).name
-    if '__' not in base:
-        return None
-    prefix = base.split('__', 1)[0]
-    if len(prefix) != 16 or not prefix.isdigit():
-        return None
-    return prefix
+    match = _LATTES_ID_RE.match(Path(filename).name)
+    return match.group(1) if match else None
 
 
 def build_manifest(id_to_filename: Dict[str, str]) -> Dict[str, Dict[str, str]]:
@@ -27,30 +27,64 @@ def build_manifest(id_to_filename: Dict[str, str]) -> Dict[str, Dict[str, str]]:
     return {"by_lattes_id": ordered}
 
 
-def sync_validation_to_pages(input_dir: Path, output_dir: Path) -> Dict[str, Dict[str, str]]:
+def _replace_file(dest: Path, write_tmp) -> None:
+    """Materialize dest through a sibling temp file + os.replace (atomic for readers)."""
+    tmp = dest.with_name(f'.{dest.name}.tmp')
+    tmp.unlink(missing_ok=True)
+    write_tmp(tmp)
+    os.replace(tmp, dest)
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    """Copy src into dest as an independent file (copyfile uses sendfile, so no userspace buffer)."""
+    _replace_file(dest, lambda tmp: shutil.copyfile(src, tmp))
+
+
+def sync_validation_to_pages(
+    input_dir: Path,
+    output_dir: Path,
+    compact: bool = False,
+) -> Dict[str, Dict[str, str]]:
     output_dir.mkdir(parents=True, exist_ok=True)
     id_to_filename: Dict[str, str] = {}
 
-    for path in sorted(input_dir.iterdir()):
-        if not path.is_file() or path.suffix.lower() != '.json':
-            continue
-        lattes_id = extract_lattes_id(path.name)
+    with os.scandir(input_dir) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if entry.name.lower().endswith('.json') and entry.is_file()
+        )
+
+    to_sync = []
+    for name in names:
+        lattes_id = extract_lattes_id(name)
         if not lattes_id:
-            print(f"Ignorando arquivo sem lattes_id valido: {path.name}")
+            print(f"Ignorando arquivo sem lattes_id valido: {name}")
             continue
-        dest = output_dir / path.name
-        shutil.copy2(path, dest)
-        if lattes_id in id_to_filename and id_to_filename[lattes_id] != path.name:
+        to_sync.append(name)
+        if lattes_id in id_to_filename and id_to_filename[lattes_id] != name:
             print(
                 "Aviso: lattes_id duplicado. Substituindo "
-                f"{id_to_filename[lattes_id]} por {path.name}."
+                f"{id_to_filename[lattes_id]} por {name}."
             )
-        id_to_filename[lattes_id] = path.name
+        id_to_filename[lattes_id] = name
+
+    # Each file is independent; overlap the copies
+    if to_sync:
+        with ThreadPoolExecutor(max_workers=min(32, len(to_sync))) as executor:
+            list(executor.map(
+                lambda name: _copy_file(input_dir / name, output_dir / name),
+                to_sync,
+            ))
 
     manifest = build_manifest(id_to_filename)
-    (output_dir / 'manifest.json').write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False),
-        encoding='utf-8',
+    if compact:
+        manifest_text = json.dumps(manifest, ensure_ascii=False, separators=(',', ':'))
+    else:
+        manifest_text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    manifest_bytes = manifest_text.encode('utf-8')
+    _replace_file(
+        output_dir / 'manifest.json',
+        lambda tmp: tmp.write_bytes(manifest_bytes),
     )
     return manifest
 
@@ -65,6 +99,11 @@ def main() -> None:
         required=True,
         help="Input dir with researchers JSONs (e.g., outputs/<batch>/researchers)",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write manifest.json without indentation (machine consumers only)",
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir).expanduser()
@@ -74,7 +113,7 @@ def main() -> None:
     repo_root = Path(__file__).resolve().parents[1]
     output_dir = repo_root / 'docs' / 'prefill'
 
-    manifest = sync_validation_to_pages(input_dir, output_dir)
+    manifest = sync_validation_to_pages(input_dir, output_dir, compact=args.compact)
     print(
         f"Sincronizado: {len(manifest['by_lattes_id'])} arquivos -> {output_dir}"
     )
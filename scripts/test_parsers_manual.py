@@ -6,15 +6,23 @@ Uso:
     python3 scripts/test_parsers_manual.py
 """
 
+import os
+import re
 import sys
 import json
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).parent.parent
+FIXTURES_DIR = ROOT_DIR / 'tests' / 'fixtures' / 'lattes'
+
 # Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT_DIR))
 
 from metricas_lattes.parser_router import parse_fixture, PARSER_REGISTRY
 
+# Matches any registered pattern in a single search per filename
+_REGISTRY_RE = re.compile('|'.join(re.escape(p) for p in PARSER_REGISTRY) or r'(?!)')
+
 
 def test_single_file(fixture_path: Path):
     """Test parsing a single file"""
@@ -76,17 +84,19 @@ def main():
         print(f"  - {pattern}: {parser_class.__name__}")
 
     # Find fixtures
-    fixtures_dir = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'lattes'
+    fixtures_dir = FIXTURES_DIR
 
     if not fixtures_dir.exists():
         print(f"\n✗ Fixtures directory not found: {fixtures_dir}")
         return 1
 
-    # Get all HTML files (exclude full_profile)
-    fixtures = [
-        f for f in sorted(fixtures_dir.glob('*.html'))
-        if 'full_profile' not in str(f)
-    ]
+    # Get all HTML files (exclude full_profile) with a single directory scan
+    with os.scandir(fixtures_dir) as entries:
+        available = {
+            e.name: e.path for e in entries
+            if e.name.endswith('.html') and 'full_profile' not in e.name and e.is_file()
+        }
+    fixtures = [Path(path) for _, path in sorted(available.items())]
 
     print(f"\nFound {len(fixtures)} fixtures")
 
@@ -102,10 +112,10 @@ def main():
     total_count = 0
 
     for test_name in test_files:
-        fixture_path = fixtures_dir / test_name
-        if fixture_path.exists():
+        path_str = available.get(test_name)
+        if path_str:
             total_count += 1
-            if test_single_file(fixture_path):
+            if test_single_file(Path(path_str)):
                 success_count += 1
         else:
             print(f"\n⚠ Fixture not found: {test_name}")
@@ -115,44 +125,40 @@ def main():
     print("TESTING ALL FIXTURES (Summary)")
     print(f"{'='*80}\n")
 
-    all_results = []
+    print(f"{'File':<60} {'Items':>6} {'Parser':>10} {'Status':>10}")
+    print("-" * 90)
+
+    # Print each row as soon as it's parsed; only the totals are kept
+    fixture_count = 0
+    successful = 0
+    failed = 0
+    total_items = 0
     for fixture_path in fixtures:
+        fixture_count += 1
         try:
             result = parse_fixture(fixture_path)
             num_items = len(result.get('items', []))
-            parser_type = "Specific" if any(
-                pattern in fixture_path.stem.lower()
-                for pattern in PARSER_REGISTRY.keys()
-            ) else "Generic"
-
-            all_results.append({
-                'name': fixture_path.name,
-                'items': num_items,
-                'parser': parser_type,
-                'status': '✓'
-            })
+            stem_lower = fixture_path.stem.lower()
+            parser_type = "Specific" if _REGISTRY_RE.search(stem_lower) else "Generic"
+            status = '✓'
+            successful += 1
+            total_items += num_items
         except Exception as e:
-            all_results.append({
-                'name': fixture_path.name,
-                'items': 0,
-                'parser': 'Error',
-                'status': f'✗ {str(e)[:40]}'
-            })
-
-    # Print table
-    print(f"{'File':<60} {'Items':>6} {'Parser':>10} {'Status':>10}")
-    print("-" * 90)
-    for r in all_results:
-        print(f"{r['name']:<60} {r['items']:>6} {r['parser']:>10} {r['status']:>10}")
+            num_items = 0
+            parser_type = 'Error'
+            status = f'✗ {str(e)[:40]}'
+            failed += 1
+
+        print(f"{fixture_path.name:<60} {num_items:>6} {parser_type:>10} {status:>10}")
 
     # Summary
     print(f"\n{'='*80}")
     print("SUMMARY")
     print(f"{'='*80}")
-    print(f"Total fixtures: {len(all_results)}")
-    print(f"Successful: {sum(1 for r in all_results if r['status'] == '✓')}")
-    print(f"Failed: {sum(1 for r in all_results if r['status'].startswith('✗'))}")
-    print(f"Total items parsed: {sum(r['items'] for r in all_results)}")
+    print(f"Total fixtures: {fixture_count}")
+    print(f"Successful: {successful}")
+    print(f"Failed: {failed}")
+    print(f"Total items parsed: {total_items}")
 
     return 0 if success_count == total_count else 1
 
@@ -1,5 +1,6 @@
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from jsonschema import Draft7Validator, exceptions
@@ -8,8 +9,7 @@ from jsonschema import Draft7Validator, exceptions
 def carregar_json(caminho):
     """Carrega um arquivo JSON a partir do caminho informado."""
     try:
-        with open(caminho, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(Path(caminho).read_bytes())
     except Exception as e:
         raise RuntimeError(f"Erro ao carregar JSON: {e}")
 
@@ -17,16 +17,27 @@ def carregar_json(caminho):
 def carregar_schema(caminho):
     """Carrega o JSON Schema."""
     try:
-        with open(caminho, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(Path(caminho).read_bytes())
     except Exception as e:
         raise RuntimeError(f"Erro ao carregar schema: {e}")
 
 
-def validar(json_dados, schema):
-    """Valida os dados contra o schema e retorna lista de erros."""
-    validator = Draft7Validator(schema)
-    erros = sorted(validator.iter_errors(json_dados), key=lambda e: e.path)
+@lru_cache(maxsize=8)
+def _validador_em_cache(caminho_schema, mtime_ns):
+    schema = carregar_schema(caminho_schema)
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
+def obter_validador(caminho_schema):
+    """Retorna o validador do schema, compilado uma vez por versão do arquivo (mtime)."""
+    caminho = Path(caminho_schema)
+    return _validador_em_cache(str(caminho), caminho.stat().st_mtime_ns)
+
+
+def validar(json_dados, validador):
+    """Valida os dados com o validador informado e retorna lista de erros."""
+    erros = sorted(validador.iter_errors(json_dados), key=lambda e: e.path)
     return erros
 
 
@@ -48,8 +59,7 @@ def main():
 
     try:
         dados = carregar_json(caminho_json)
-        schema = carregar_schema(caminho_schema)
-        erros = validar(dados, schema)
+        erros = validar(dados, obter_validador(caminho_schema))
 
         if not erros:
             print("✅ JSON válido segundo o schema do INCT NanoAgro.")
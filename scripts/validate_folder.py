@@ -12,9 +12,14 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -28,61 +33,51 @@ def load_schema(schema_path: Path) -> dict:
         return json.load(f)
 
 
-def validate_against_schema(data: dict, schema: dict) -> list:
-    """Validate data against JSON Schema"""
+def build_validator(schema: dict, check: bool = True):
+    """Compile the JSON Schema once; returns None if jsonschema is unavailable"""
     try:
-        from jsonschema import Draft7Validator
+        from jsonschema.validators import validator_for
     except ImportError:
-        try:
-            from jsonschema import Draft202012Validator as Draft7Validator
-        except ImportError:
-            return ["jsonschema não instalado - não é possível validar"]
+        return None
 
-    validator = Draft7Validator(schema)
-    errors = []
+    klass = validator_for(schema)
+    if check:
+        klass.check_schema(schema)
+    return klass(schema)
 
-    for error in validator.iter_errors(data):
-        path = '.'.join(str(p) for p in error.path) if error.path else 'root'
-        errors.append({
-            'path': path,
-            'message': error.message
-        })
 
-    return errors
+def validate_against_schema(data: dict, validator) -> list:
+    """Validate data with a precompiled JSON Schema validator"""
+    return [
+        {
+            'path': '.'.join(map(str, error.path)) or 'root',
+            'message': error.message
+        }
+        for error in validator.iter_errors(data)
+    ]
 
 
-def process_file(filepath: Path, schema: dict = None) -> dict:
+def process_file(filepath: Path, validator=None) -> dict:
     """Process a single file and return result"""
-    print(f"  Processing: {filepath.name}...", end=" ")
-
     try:
         # Parse
         result = parse_fixture(filepath)
 
         # Validate if schema provided
         schema_errors = []
-        if schema:
-            schema_errors = validate_against_schema(result, schema)
-
-        # Determine success
-        success = len(schema_errors) == 0 if schema else True
-
-        if success:
-            print(f"✓ OK ({len(result['items'])} items)")
-        else:
-            print(f"✗ FAIL ({len(schema_errors)} schema errors)")
+        if validator is not None:
+            schema_errors = validate_against_schema(result, validator)
 
         return {
             'filepath': str(filepath),
             'filename': filepath.name,
-            'success': success,
+            'success': len(schema_errors) == 0,
             'items_count': len(result['items']),
             'schema_errors': schema_errors,
             'result': result
         }
 
     except Exception as e:
-        print(f"✗ ERROR: {str(e)[:50]}")
         return {
             'filepath': str(filepath),
             'filename': filepath.name,
@@ -93,6 +88,63 @@ def process_file(filepath: Path, schema: dict = None) -> dict:
         }
 
 
+@dataclass
+class ResultSummary:
+    """What the reports need from a processed file (the parsed payload is not kept)"""
+    filename: str
+    success: bool
+    items_count: int
+    schema_errors: List[dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error is not None or bool(self.schema_errors)
+
+
+def status_line(summary: ResultSummary) -> str:
+    """One-line console status for a processed file"""
+    if summary.error is not None:
+        return f"✗ ERROR: {summary.error[:50]}"
+    if summary.success:
+        return f"✓ OK ({summary.items_count} items)"
+    return f"✗ FAIL ({len(summary.schema_errors)} schema errors)"
+
+
+# Per-worker validator, compiled once by _init_worker
+_worker_validator = None
+
+
+def _init_worker(schema) -> None:
+    # The parent already ran check_schema; workers only build their validator
+    global _worker_validator
+    _worker_validator = build_validator(schema, check=False) if schema else None
+
+
+def _process_worker(
+    filepath: Path,
+    output_dir: Path,
+    write_individual: bool,
+    compact: bool = True
+) -> ResultSummary:
+    """Process-pool worker: parse, validate and save the JSON; returns only the summary"""
+    result = process_file(filepath, _worker_validator)
+    if write_individual and result['result']:
+        output_path = output_dir / f"{filepath.stem}.json"
+        if compact:
+            text = json.dumps(result['result'], ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(result['result'], indent=2, ensure_ascii=False)
+        output_path.write_text(text, encoding='utf-8')
+    return ResultSummary(
+        filename=result['filename'],
+        success=result['success'],
+        items_count=result['items_count'],
+        schema_errors=result.get('schema_errors', []),
+        error=result.get('error')
+    )
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -117,6 +169,11 @@ def main():
         '--skip-individual', action='store_true',
         help='Skip individual JSON output (only summary + errors)'
     )
+    parser.add_argument(
+        '--compact', action=argparse.BooleanOptionalAction, default=True,
+        help='Write individual JSONs without indentation (default). '
+             'Use --no-compact for indent=2; summary/errors are always indented'
+    )
 
     args = parser.parse_args()
 
@@ -135,22 +192,30 @@ def main():
 
     # Load schema
     schema = None
+    validator = None
     if schema_path.exists():
         try:
             schema = load_schema(schema_path)
+            validator = build_validator(schema)
             print(f"✓ Schema loaded: {schema_path}")
         except Exception as e:
             print(f"✗ Error loading schema: {e}", file=sys.stderr)
             return 1
+        if validator is None:
+            print("✗ jsonschema não instalado - não é possível validar", file=sys.stderr)
+            return 1
     else:
         print(f"⚠ Schema not found: {schema_path} - skipping validation")
 
     # Find HTML files
-    html_files = [
-        f for f in sorted(input_dir.glob('*.html'))
-        if not f.name.startswith('._')  # Skip AppleDouble
-        and 'full_profile' not in str(f)  # Skip full_profile
-    ]
+    with os.scandir(input_dir) as entries:
+        html_files = [
+            Path(e.path) for e in sorted(entries, key=lambda e: e.name)
+            if e.name.endswith('.html')
+            and not e.name.startswith('._')  # Skip AppleDouble
+            and 'full_profile' not in e.path  # Skip full_profile
+            and e.is_file()
+        ]
 
     if not html_files:
         print(f"✗ No HTML files found in {input_dir}", file=sys.stderr)
@@ -161,16 +226,22 @@ def main():
     print()
 
     # Process files
+    # Each file is parsed, validated and written inside a worker; map keeps input order
     results = []
-    for filepath in html_files:
-        result = process_file(filepath, schema)
-        results.append(result)
-
-        # Save individual JSON
-        if not args.skip_individual and result['result']:
-            output_path = output_dir / f"{filepath.stem}.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result['result'], f, indent=2, ensure_ascii=False)
+    worker = partial(
+        _process_worker,
+        output_dir=output_dir,
+        write_individual=not args.skip_individual,
+        compact=args.compact
+    )
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(schema,)
+    ) as executor:
+        for filepath, result in zip(html_files, executor.map(worker, html_files, chunksize=4)):
+            print(f"  Processing: {filepath.name}... {status_line(result)}")
+            results.append(result)
 
     # Generate summary
     print()
@@ -179,9 +250,9 @@ def main():
     print("="*60)
 
     total = len(results)
-    success_count = sum(1 for r in results if r['success'])
+    success_count = sum(1 for r in results if r.success)
     fail_count = total - success_count
-    total_items = sum(r['items_count'] for r in results)
+    total_items = sum(r.items_count for r in results)
 
     print(f"Total files: {total}")
     print(f"Success: {success_count}")
@@ -204,18 +275,20 @@ def main():
         },
         'files': [
             {
-                'filename': r['filename'],
-                'success': r['success'],
-                'items_count': r['items_count'],
-                'has_errors': 'error' in r or len(r.get('schema_errors', [])) > 0
+                'filename': r.filename,
+                'success': r.success,
+                'items_count': r.items_count,
+                'has_errors': r.has_errors
             }
             for r in results
         ]
     }
 
     summary_path = output_dir / 'summary.json'
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    summary_path.write_text(
+        json.dumps(summary, indent=2, ensure_ascii=False),
+        encoding='utf-8'
+    )
 
     print(f"\n✓ Summary saved: {summary_path}")
 
@@ -226,19 +299,21 @@ def main():
         },
         'errors': [
             {
-                'filename': r['filename'],
-                'parse_error': r.get('error'),
-                'schema_errors': r.get('schema_errors', [])
+                'filename': r.filename,
+                'parse_error': r.error,
+                'schema_errors': r.schema_errors
             }
             for r in results
-            if 'error' in r or r.get('schema_errors')
+            if r.has_errors
         ]
     }
 
     if errors_report['errors']:
         errors_path = output_dir / 'errors.json'
-        with open(errors_path, 'w', encoding='utf-8') as f:
-            json.dump(errors_report, f, indent=2, ensure_ascii=False)
+        errors_path.write_text(
+            json.dumps(errors_report, indent=2, ensure_ascii=False),
+            encoding='utf-8'
+        )
 
         print(f"✓ Errors report saved: {errors_path}")
 
@@ -0,0 +1,40 @@
+"""
+Shared pytest hooks for the test suite.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+def _install_fixture(src: Path, dst: Path) -> None:
+    """Expose a read-only fixture in the input dir without copying its bytes"""
+    try:
+        os.symlink(src.resolve(), dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+@pytest.fixture(scope='session')
+def install_fixture():
+    """Callable `(src, dst)` that symlinks a fixture into place, copying if links are unavailable"""
+    return _install_fixture
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Under pytest-xdist, pin every test of one fixture file to the same worker.
+
+    Parsed fixtures are memoized per process, so grouping by fixture keeps
+    that cache warm when running `pytest -n auto --dist loadgroup`.
+    """
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+
+    for item in items:
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None and 'fixture_path' in callspec.params:
+            fixture_name = callspec.params['fixture_path'].name
+            item.add_marker(pytest.mark.xdist_group(name=fixture_name))
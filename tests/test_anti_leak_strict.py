@@ -5,12 +5,16 @@ Strict, non-tolerant rules to prevent author leakage into titles and venues.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+import metricas_lattes
 from metricas_lattes.parser_router import normalize_filename, parse_fixture
 
 
@@ -22,36 +26,50 @@ FIXTURE_KEYS = {
     "textos": "textos em jornais de noticias revistas",
 }
 
+_PAT_AUTHOR_START = re.compile(r"^[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
+_PAT_AUTHOR_INLINE = re.compile(r"[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
+_PAT_AUTHOR_IN_PREFIX = re.compile(r"\b[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
+_PAT_YEAR_END = re.compile(r"\b(19|20)\d{2}\.?$")
+
+
+# normalized name -> fixture path; reverse order so the first file by name wins on collisions
+_FIXTURE_INDEX = {
+    normalize_filename(html_file.name).lower(): html_file
+    for html_file in sorted(FIXTURES_DIR.glob("*.html"), reverse=True)
+    if not html_file.name.startswith((".", "_"))
+}
+
 
 def _find_fixture_by_normalized_key(normalized_key: str) -> Path:
-    for html_file in FIXTURES_DIR.glob("*.html"):
-        if html_file.name.startswith((".", "_")):
-            continue
-        normalized = normalize_filename(html_file.name)
-        if normalized_key.lower() == normalized.lower():
-            return html_file
-    raise FileNotFoundError(f"Nenhum fixture encontrado para: {normalized_key}")
+    try:
+        return _FIXTURE_INDEX[normalized_key.lower()]
+    except KeyError:
+        raise FileNotFoundError(f"Nenhum fixture encontrado para: {normalized_key}") from None
 
 
 def _norm(value: str | None) -> str:
     if value is None:
         return ""
-    text = unicodedata.normalize("NFD", str(value))
+    return _norm_text(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _norm_text(value: str) -> str:
+    text = unicodedata.normalize("NFD", value)
     text = "".join(ch for ch in text if unicodedata.category(ch) != "Mn")
-    text = re.sub(r"\s+", " ", text).strip()
-    return text.lower()
+    return " ".join(text.split()).lower()
 
 
 def _author_prefix(raw: str | None) -> str | None:
     if not raw:
         return None
-    if " . " in raw:
-        prefix = raw.split(" . ", 1)[0]
-    elif ". " in raw:
-        prefix = raw.split(". ", 1)[0]
-    else:
-        return None
-    if ";" in prefix or re.search(r"\b[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]", prefix):
+    cut = raw.find(" . ")
+    if cut == -1:
+        cut = raw.find(". ")
+        if cut == -1:
+            return None
+    prefix = raw[:cut]
+    if ";" in prefix or _PAT_AUTHOR_IN_PREFIX.search(prefix):
         return prefix
     return None
 
@@ -61,103 +79,142 @@ def _authors_are_valid(autores: str | None) -> bool:
         return False
     if ";" in autores or "," in autores:
         return True
-    tokens = [t for t in autores.split() if t]
-    return len(tokens) >= 2
-
-
-@pytest.fixture(scope="module")
-def parsed_results() -> dict[str, dict]:
+    return len(autores.split()) >= 2
+
+
+def _parser_source_digest() -> str:
+    """Hash of the parser package sources, so cached parses expire when the code changes."""
+    digest = hashlib.sha1()
+    package_dir = Path(metricas_lattes.__file__).parent
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _parse_fixture_cached(fixture_path: Path, cache, source_digest: str) -> dict:
+    """parse_fixture backed by .pytest_cache, keyed by HTML + parser source hashes."""
+    digest = hashlib.sha1(fixture_path.read_bytes())
+    digest.update(source_digest.encode("ascii"))
+    cache_key = f"parse_fixture/{digest.hexdigest()}"
+    result = cache.get(cache_key, None)
+    if result is None:
+        result = parse_fixture(fixture_path)
+        cache.set(cache_key, result)
+    return result
+
+
+@pytest.fixture(scope="session")
+def parsed_results(pytestconfig: pytest.Config) -> dict[str, dict]:
+    # Opt-in (METRICAS_PARSE_CACHE=1): reuse parses across runs; off by default for CI
+    use_cache = os.environ.get("METRICAS_PARSE_CACHE") == "1" and pytestconfig.cache is not None
+    source_digest = _parser_source_digest() if use_cache else ""
     results = {}
     for key, normalized in FIXTURE_KEYS.items():
         fixture_path = _find_fixture_by_normalized_key(normalized)
-        results[key] = parse_fixture(fixture_path)
+        if use_cache:
+            results[key] = _parse_fixture_cached(fixture_path, pytestconfig.cache, source_digest)
+        else:
+            results[key] = parse_fixture(fixture_path)
     return results
 
 
-def test_rule_a_titles_do_not_start_with_author_pattern(parsed_results: dict[str, dict]) -> None:
-    pattern = re.compile(r"^[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
-    for data in parsed_results.values():
-        for item in data["items"]:
-            titulo = item.get("titulo") or ""
-            assert not pattern.search(titulo), f"Titulo inicia com autor: {titulo}"
+@pytest.fixture(params=list(FIXTURE_KEYS))
+def fixture_items(request, parsed_results: dict[str, dict]) -> list[dict]:
+    """Items of one parsed fixture; the rules run once per fixture key."""
+    return parsed_results[request.param]["items"]
 
 
-def test_rule_b_titles_do_not_contain_semicolon_separator(parsed_results: dict[str, dict]) -> None:
-    for data in parsed_results.values():
+@pytest.fixture(scope="session")
+def items_by_numero(parsed_results: dict[str, dict]) -> dict[str, dict[int, dict]]:
+    """numero_item -> item per fixture key (first occurrence wins)."""
+    index: dict[str, dict[int, dict]] = {}
+    for key, data in parsed_results.items():
+        by_numero = index[key] = {}
         for item in data["items"]:
-            titulo = item.get("titulo") or ""
-            assert " ; " not in titulo, f"Titulo contem separador de autores: {titulo}"
+            by_numero.setdefault(item.get("numero_item"), item)
+    return index
 
 
-def test_rule_c_title_does_not_contain_author_prefix_from_raw(parsed_results: dict[str, dict]) -> None:
-    for data in parsed_results.values():
-        for item in data["items"]:
-            titulo = item.get("titulo") or ""
-            raw = item.get("raw") or ""
-            prefix = _author_prefix(raw)
-            if not prefix or not titulo:
-                continue
-            assert _norm(prefix) not in _norm(titulo), (
-                f"Titulo contem prefixo de autores: {titulo}"
-            )
-
-
-def test_rule_d_autores_obrigatorio_e_consistente(parsed_results: dict[str, dict]) -> None:
-    for data in parsed_results.values():
-        for item in data["items"]:
-            autores = item.get("autores")
-            assert _authors_are_valid(autores), f"Autores invalidos: {autores}"
+def test_rule_a_titles_do_not_start_with_author_pattern(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        titulo = item.get("titulo") or ""
+        assert not _PAT_AUTHOR_START.search(titulo), f"Titulo inicia com autor: {titulo}"
 
 
-def test_rule_e_veiculo_nao_contem_autores_ou_separadores(parsed_results: dict[str, dict]) -> None:
-    pattern = re.compile(r"[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
-    for data in parsed_results.values():
-        for item in data["items"]:
-            veiculo = item.get("veiculo")
-            if not veiculo:
-                continue
-            assert ";" not in veiculo, f"Veiculo contem ';': {veiculo}"
-            assert not pattern.search(veiculo), f"Veiculo parece lista de autores: {veiculo}"
+def test_rule_b_titles_do_not_contain_semicolon_separator(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        titulo = item.get("titulo") or ""
+        assert " ; " not in titulo, f"Titulo contem separador de autores: {titulo}"
 
 
-def test_rule_f_raw_existe_e_contem_titulo(parsed_results: dict[str, dict]) -> None:
-    for data in parsed_results.values():
-        for item in data["items"]:
-            raw = item.get("raw") or ""
-            titulo = item.get("titulo") or ""
-            assert len(raw) > 20, f"Raw muito curto: {raw}"
-            assert titulo, f"Titulo ausente para raw: {raw}"
-            assert _norm(titulo) in _norm(raw), f"Titulo nao encontrado no raw: {titulo}"
+def test_rule_c_title_does_not_contain_author_prefix_from_raw(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        titulo = item.get("titulo") or ""
+        raw = item.get("raw") or ""
+        prefix = _author_prefix(raw)
+        if not prefix or not titulo:
+            continue
+        norm_prefix = _norm(prefix)
+        norm_titulo = _norm(titulo)
+        assert norm_prefix not in norm_titulo, (
+            f"Titulo contem prefixo de autores: {titulo}"
+        )
 
 
-def test_rule_g_titulo_nao_termina_com_ano(parsed_results: dict[str, dict]) -> None:
-    pattern = re.compile(r"\b(19|20)\d{2}\.?$")
-    for data in parsed_results.values():
-        for item in data["items"]:
-            titulo = item.get("titulo") or ""
-            assert not pattern.search(titulo), f"Titulo termina com ano: {titulo}"
+def test_rule_d_autores_obrigatorio_e_consistente(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        autores = item.get("autores")
+        assert _authors_are_valid(autores), f"Autores invalidos: {autores}"
+
+
+def test_rule_e_veiculo_nao_contem_autores_ou_separadores(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        veiculo = item.get("veiculo")
+        if not veiculo:
+            continue
+        assert ";" not in veiculo, f"Veiculo contem ';': {veiculo}"
+        assert not _PAT_AUTHOR_INLINE.search(veiculo), f"Veiculo parece lista de autores: {veiculo}"
+
+
+def test_rule_f_raw_existe_e_contem_titulo(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        raw = item.get("raw") or ""
+        titulo = item.get("titulo") or ""
+        assert len(raw) > 20, f"Raw muito curto: {raw}"
+        assert titulo, f"Titulo ausente para raw: {raw}"
+        assert _norm(titulo) in _norm(raw), f"Titulo nao encontrado no raw: {titulo}"
 
 
-def test_rule_h_fingerprint_unico_por_fixture(parsed_results: dict[str, dict]) -> None:
-    for data in parsed_results.values():
-        fingerprints = [item.get("fingerprint_sha1") for item in data["items"]]
-        fingerprints = [fp for fp in fingerprints if fp]
-        assert len(fingerprints) == len(set(fingerprints)), "Fingerprint duplicado no fixture"
+def test_rule_g_titulo_nao_termina_com_ano(fixture_items: list[dict]) -> None:
+    for item in fixture_items:
+        titulo = item.get("titulo") or ""
+        assert not _PAT_YEAR_END.search(titulo), f"Titulo termina com ano: {titulo}"
+
+
+def test_rule_h_fingerprint_unico_por_fixture(fixture_items: list[dict]) -> None:
+    seen = set()
+    for item in fixture_items:
+        fingerprint = item.get("fingerprint_sha1")
+        if not fingerprint:
+            continue
+        assert fingerprint not in seen, f"Fingerprint duplicado no fixture: {fingerprint}"
+        seen.add(fingerprint)
 
 
-def _item_by_numero(items: list[dict], numero_item: int) -> dict:
-    for item in items:
-        if item.get("numero_item") == numero_item:
-            return item
-    raise AssertionError(f"Item numero {numero_item} nao encontrado")
+def _item_by_numero(by_numero: dict[int, dict], numero_item: int) -> dict:
+    item = by_numero.get(numero_item)
+    if item is None:
+        raise AssertionError(f"Item numero {numero_item} nao encontrado")
+    return item
 
 
 def _assert_norm_equal(actual: str | None, expected: str) -> None:
     assert _norm(actual) == _norm(expected), f"Esperado: {expected} | Atual: {actual}"
 
 
-def test_representative_items_artigos(parsed_results: dict[str, dict]) -> None:
-    items = parsed_results["artigos"]["items"]
+def test_representative_items_artigos(items_by_numero: dict[str, dict[int, dict]]) -> None:
+    items = items_by_numero["artigos"]
 
     item_1 = _item_by_numero(items, 1)
     _assert_norm_equal(
@@ -196,8 +253,8 @@ def test_representative_items_artigos(parsed_results: dict[str, dict]) -> None:
     assert item_5.get("ano") == 2025
 
 
-def test_representative_items_capitulos(parsed_results: dict[str, dict]) -> None:
-    items = parsed_results["capitulos"]["items"]
+def test_representative_items_capitulos(items_by_numero: dict[str, dict[int, dict]]) -> None:
+    items = items_by_numero["capitulos"]
 
     item_1 = _item_by_numero(items, 1)
     _assert_norm_equal(
@@ -242,8 +299,8 @@ def test_representative_items_capitulos(parsed_results: dict[str, dict]) -> None
     assert item_4.get("ano") == 2024
 
 
-def test_representative_items_textos(parsed_results: dict[str, dict]) -> None:
-    items = parsed_results["textos"]["items"]
+def test_representative_items_textos(items_by_numero: dict[str, dict[int, dict]]) -> None:
+    items = items_by_numero["textos"]
 
     item_1 = _item_by_numero(items, 1)
     _assert_norm_equal(item_1.get("titulo"), "Nano-herbicidas no combate a daninhas")
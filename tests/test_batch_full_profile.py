@@ -215,6 +215,10 @@ class TestBatchIntegration:
         if not result1['success']:
             pytest.fail(f"First processing failed: {result1.get('error')}")
 
+        # Both runs write the same output path: load run 1 before run 2 overwrites it
+        with open(result1['output_json'], 'r', encoding='utf-8') as f:
+            data1 = json.load(f)
+
         result2 = process_researcher_file(fixture_path, TEST_OUTPUT_DIR, schema=None)
 
         # Verify second result succeeded
@@ -226,10 +230,6 @@ class TestBatchIntegration:
         assert result1['total_items'] == result2['total_items']
         assert result1['success'] == result2['success']
 
-        # Load both JSONs
-        with open(result1['output_json'], 'r', encoding='utf-8') as f:
-            data1 = json.load(f)
-
         with open(result2['output_json'], 'r', encoding='utf-8') as f:
             data2 = json.load(f)
 
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import html as html_lib
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
+from lxml import etree
+from openpyxl import load_workbook
 
+from metricas_lattes.batch_full_profile import main as batch_main
+from metricas_lattes.exports.validation_pack import main as validation_pack_main
 from metricas_lattes.parser_router import normalize_filename
 
 
@@ -20,14 +26,18 @@ TARGET_SECTIONS = {
     "textos em jornais de noticias revistas",
 }
 
+_AUTHOR_RE = re.compile(r"[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
+
 
 def _select_diverse_profiles(input_dir: Path) -> list[Path]:
-    html_files = [
-        path
-        for path in input_dir.glob("*.html")
-        if path.is_file() and not path.name.startswith("._")
-    ]
-    html_files.sort(key=lambda path: path.stat().st_size)
+    with os.scandir(input_dir) as entries:
+        html_files = sorted(
+            (entry.stat().st_size, entry.path)
+            for entry in entries
+            if entry.name.endswith(".html")
+            and not entry.name.startswith("._")
+            and entry.is_file()
+        )
     if not html_files:
         return []
     indices = [0, len(html_files) // 2, len(html_files) - 1]
@@ -35,32 +45,48 @@ def _select_diverse_profiles(input_dir: Path) -> list[Path]:
     seen = set()
     for index in indices:
         if 0 <= index < len(html_files):
-            candidate = html_files[index]
+            candidate = html_files[index][1]
             if candidate not in seen:
-                selected.append(candidate)
+                selected.append(Path(candidate))
                 seen.add(candidate)
     return selected
 
 
+@lru_cache(maxsize=1)
 def _load_schema() -> dict:
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return json.loads(SCHEMA_PATH.read_bytes())
 
 
-def _validate_schema(payload: dict, schema: dict) -> list[str]:
+@lru_cache(maxsize=1)
+def _validator():
     from jsonschema import Draft202012Validator
 
-    validator = Draft202012Validator(schema)
+    return Draft202012Validator(_load_schema())
+
+
+def _validate_schema(payload: dict) -> list[str]:
     errors = []
-    for error in sorted(validator.iter_errors(payload), key=lambda err: list(err.path)):
+    for error in sorted(_validator().iter_errors(payload), key=lambda err: list(err.path)):
         path = ".".join(str(part) for part in error.path)
         errors.append(f"{path}: {error.message}" if path else error.message)
     return errors
 
 
+def _run_stage(module: str, entry_point, args: list[str]) -> None:
+    if os.environ.get("METRICAS_TEST_SUBPROCESS") == "1":
+        run = subprocess.run(
+            [sys.executable, "-m", module, *args], capture_output=True, text=True
+        )
+        assert run.returncode == 0, run.stdout + run.stderr
+        return
+    assert entry_point(args) == 0, f"{module} failed"
+
+
+@lru_cache(maxsize=4096)
 def _normalize_section(value: str) -> str:
     normalized = normalize_filename(value)
     normalized = normalized.replace("/", " ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = " ".join(normalized.split())
     return normalized
 
 
@@ -78,12 +104,13 @@ def test_full_pipeline_validation_pack(tmp_path: Path) -> None:
     temp_in.mkdir(parents=True, exist_ok=True)
 
     for path in selected:
-        (temp_in / path.name).write_bytes(path.read_bytes())
+        staged = temp_in / path.name
+        try:
+            os.link(path, staged)
+        except OSError:
+            shutil.copyfile(path, staged)
 
-    batch_cmd = [
-        sys.executable,
-        "-m",
-        "metricas_lattes.batch_full_profile",
+    batch_args = [
         "--in",
         str(temp_in),
         "--out",
@@ -93,24 +120,19 @@ def test_full_pipeline_validation_pack(tmp_path: Path) -> None:
         "--years",
         "all",
     ]
-    batch_run = subprocess.run(batch_cmd, capture_output=True, text=True)
-    assert batch_run.returncode == 0, batch_run.stdout + batch_run.stderr
+    _run_stage("metricas_lattes.batch_full_profile", batch_main, batch_args)
 
     researchers_dir = temp_out / "researchers"
     json_paths = sorted(researchers_dir.glob("*.json"))
     assert len(json_paths) == len(selected)
 
-    schema = _load_schema()
     for json_path in json_paths:
-        payload = json.loads(json_path.read_text(encoding="utf-8"))
-        errors = _validate_schema(payload, schema)
+        payload = json.loads(json_path.read_bytes())
+        errors = _validate_schema(payload)
         assert not errors, f"{json_path.name} schema errors: {errors}"
 
     validation_dir = temp_out / "validation"
-    validation_cmd = [
-        sys.executable,
-        "-m",
-        "metricas_lattes.exports.validation_pack",
+    validation_args = [
         "--in",
         str(researchers_dir),
         "--out",
@@ -119,24 +141,23 @@ def test_full_pipeline_validation_pack(tmp_path: Path) -> None:
         "html",
         "xlsx",
     ]
-    validation_run = subprocess.run(validation_cmd, capture_output=True, text=True)
-    assert validation_run.returncode == 0, validation_run.stdout + validation_run.stderr
+    _run_stage("metricas_lattes.exports.validation_pack", validation_pack_main, validation_args)
 
     html_files = list(validation_dir.glob("researchers/*/VALIDACAO.html"))
     xlsx_files = list(validation_dir.glob("researchers/*/VALIDACAO.xlsx"))
     assert len(html_files) == len(selected)
     assert len(xlsx_files) == len(selected)
 
-    author_pattern = re.compile(r"^[A-ZÀ-Ü]{2,},\s*[A-ZÀ-Ü]")
     for html_path in html_files:
-        html_text = html_path.read_text(encoding="utf-8")
-        rows = re.findall(r"<tr>(.*?)</tr>", html_text, flags=re.DOTALL)
         inspected = 0
-        for row in rows:
-            cells = re.findall(r"<td[^>]*>(.*?)</td>", row, flags=re.DOTALL)
-            if len(cells) < 3:
-                continue
-            titulo = html_lib.unescape(re.sub(r"<[^>]+>", "", cells[1])).strip()
+        rows = etree.iterparse(
+            str(html_path), events=("end",), tag="tr", html=True, encoding="utf-8"
+        )
+        for _, row in rows:
+            cells = row.findall("td")
+            # itertext() already decodes entities
+            titulo = "".join(cells[1].itertext()).strip() if len(cells) >= 3 else ""
+            row.clear()
             if not titulo:
                 continue
             inspected += 1
@@ -145,11 +166,9 @@ def test_full_pipeline_validation_pack(tmp_path: Path) -> None:
 
     total_target_rows = 0
     for xlsx_path in xlsx_files:
-        from openpyxl import load_workbook
-
-        workbook = load_workbook(xlsx_path)
+        workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
         sheet = workbook.active
-        headers = [cell.value for cell in sheet[1]]
+        headers = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True))
         col_index = {name: idx for idx, name in enumerate(headers)}
 
         titulo_col = col_index.get("titulo")
@@ -165,16 +184,22 @@ def test_full_pipeline_validation_pack(tmp_path: Path) -> None:
             titulo = row[titulo_col]
             autores = row[autores_col]
             section = row[section_col]
+            # values_only rows already hold str for text cells
+            if titulo is not None and not isinstance(titulo, str):
+                titulo = str(titulo)
+            if not isinstance(section, str):
+                section = str(section or "")
 
             if titulo:
-                assert " ; " not in str(titulo), f"Titulo com separador em XLSX: {titulo}"
+                assert " ; " not in titulo, f"Titulo com separador em XLSX: {titulo}"
 
-            normalized_section = _normalize_section(str(section or ""))
+            normalized_section = _normalize_section(section)
             if normalized_section in TARGET_SECTIONS:
                 target_rows += 1
                 if titulo:
-                    assert not author_pattern.search(str(titulo)), f"Titulo com autores em XLSX: {titulo}"
+                    assert not _AUTHOR_RE.match(titulo), f"Titulo com autores em XLSX: {titulo}"
                 assert autores, f"Autores vazio em XLSX para secao {section}: {titulo}"
+        workbook.close()
 
         total_target_rows += target_rows
 
@@ -2,22 +2,20 @@
 
 from pathlib import Path
 import json
-import re
+
+from lxml import html as lxml_html
 
 from metricas_lattes.exports.validation_pack import generate_validation_pack
 
 
 def _extract_titles_from_html(html: str) -> list[str]:
-    tbody_match = re.search(r"<tbody>(.*?)</tbody>", html, re.S)
-    assert tbody_match is not None
-    tbody = tbody_match.group(1)
-    rows = re.findall(r"<tr>\s*(.*?)\s*</tr>", tbody, re.S)
+    tbody = lxml_html.fromstring(html).find(".//tbody")
+    assert tbody is not None
     titles: list[str] = []
-    for row in rows:
-        cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.S)
+    for row in tbody.iter("tr"):
+        cells = row.findall("td")
         if len(cells) >= 2:
-            title = re.sub(r"<.*?>", "", cells[1]).strip()
-            titles.append(title)
+            titles.append(cells[1].text_content().strip())
     return titles
 
 
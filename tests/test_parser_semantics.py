@@ -8,6 +8,9 @@ import pytest
 from metricas_lattes.parser_router import parse_fixture
 
 
+_YEAR_WORD_RE = re.compile(r'\b(19|20)\d{2}\b')
+
+
 def _write_fixture(tmp_path: Path, filename: str, body: str) -> Path:
     html = f"""
     <html><body>
@@ -33,7 +36,7 @@ def test_autores_cleaned_and_renumbered_for_artigos(tmp_path: Path) -> None:
     item = result['items'][0]
     assert item['numero_item'] == 1
     assert item['autores'] is not None
-    assert re.search(r'\b(19|20)\d{2}\b', item['autores']) is None
+    assert _YEAR_WORD_RE.search(item['autores']) is None
 
 
 def test_filter_invalid_titles_and_renumber_for_bancas(tmp_path: Path) -> None:
@@ -71,4 +74,4 @@ def test_autores_without_years_in_generic(tmp_path: Path) -> None:
 
     assert result['items']
     autores = result['items'][0].get('autores') or ''
-    assert re.search(r'\b(19|20)\d{2}\b', autores) is None
+    assert _YEAR_WORD_RE.search(autores) is None
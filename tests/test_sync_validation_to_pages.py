@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 import importlib.util
 
@@ -10,10 +12,12 @@ import importlib.util
 SCRIPT_PATH = Path('scripts/sync_validation_to_pages.py')
 
 
+@lru_cache(maxsize=1)
 def _load_script_module():
     spec = importlib.util.spec_from_file_location('sync_validation_to_pages', SCRIPT_PATH)
     module = importlib.util.module_from_spec(spec)
     assert spec.loader is not None
+    sys.modules[spec.name] = module
     spec.loader.exec_module(module)
     return module
 
@@ -24,6 +28,8 @@ def test_extract_lattes_id() -> None:
     assert module.extract_lattes_id('4741480538883395__leonardo-fernandes-fraceto.json') == '4741480538883395'
     assert module.extract_lattes_id('short__name.json') is None
     assert module.extract_lattes_id('nounderscore.json') is None
+    assert module.extract_lattes_id('47414805388833950__extra.json') is None
+    assert module.extract_lattes_id('474148053888339٥__unicode.json') is None
 
 
 def test_manifest_order_deterministic(tmp_path: Path) -> None:
@@ -49,3 +55,43 @@ def test_manifest_order_deterministic(tmp_path: Path) -> None:
     assert list(manifest_on_disk['by_lattes_id'].keys()) == expected_order
     assert (output_dir / '1111111111111111__alpha.json').exists()
     assert (output_dir / '9999999999999999__zeta.json').exists()
+
+
+def test_resync_replaces_existing_outputs(tmp_path: Path) -> None:
+    module = _load_script_module()
+
+    input_dir = tmp_path / 'input'
+    output_dir = tmp_path / 'out'
+    input_dir.mkdir()
+    output_dir.mkdir()
+
+    source = input_dir / '1111111111111111__alpha.json'
+    source.write_text('{"v": 1}', encoding='utf-8')
+    module.sync_validation_to_pages(input_dir, output_dir)
+
+    # Rewrite the source in place, as batch_full_profile does; the published copy must not follow
+    source.write_text('{"v": 2}', encoding='utf-8')
+    synced = output_dir / '1111111111111111__alpha.json'
+    assert json.loads(synced.read_text(encoding='utf-8')) == {'v': 1}
+
+    module.sync_validation_to_pages(input_dir, output_dir)
+    assert json.loads(synced.read_text(encoding='utf-8')) == {'v': 2}
+    assert sorted(p.name for p in output_dir.iterdir()) == [
+        '1111111111111111__alpha.json',
+        'manifest.json',
+    ]
+
+
+def test_compact_manifest(tmp_path: Path) -> None:
+    module = _load_script_module()
+
+    input_dir = tmp_path / 'input'
+    output_dir = tmp_path / 'out'
+    input_dir.mkdir()
+
+    (input_dir / '1111111111111111__alpha.json').write_text('{"ok": true}', encoding='utf-8')
+    manifest = module.sync_validation_to_pages(input_dir, output_dir, compact=True)
+
+    text = (output_dir / 'manifest.json').read_text(encoding='utf-8')
+    assert '\n' not in text
+    assert json.loads(text) == manifest
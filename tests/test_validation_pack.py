@@ -3,9 +3,9 @@
 from pathlib import Path
 import json
 import re
-import shutil
 
 import pytest
+from lxml import html as lxml_html
 
 from metricas_lattes.exports.validation_pack import (
     generate_validation_pack,
@@ -18,62 +18,60 @@ from metricas_lattes.batch_full_profile import process_researcher_file
 FIXTURE_PATH = Path('tests/fixtures/validation_pack/carlos_alberto_perez.json')
 FRACETO_FIXTURE = Path('tests/fixtures/lattes/full_profile/full_profile_leonardo_fraceto.html')
 
+_COUNT_SUFFIX_RE = re.compile(r'\s*\(\d+\)\s*$')
 
-def test_generate_validation_pack_html(tmp_path: Path) -> None:
-    if not FIXTURE_PATH.exists():
-        pytest.skip(f"Fixture not found: {FIXTURE_PATH}")
-
-    input_dir = tmp_path / 'input'
-    output_dir = tmp_path / 'out'
-    input_dir.mkdir()
-
-    fixture_copy = input_dir / FIXTURE_PATH.name
-    shutil.copyfile(FIXTURE_PATH, fixture_copy)
-
-    generate_validation_pack(input_dir, output_dir, ['html'])
-
-    lattes_id = json.loads(fixture_copy.read_text(encoding='utf-8'))['researcher']['lattes_id']
-    html_path = output_dir / 'researchers' / f'{lattes_id}__' / 'VALIDACAO.html'
-    assert html_path.exists()
 
-    full_name = json.loads(fixture_copy.read_text(encoding='utf-8'))['researcher']['full_name']
-    html = html_path.read_text(encoding='utf-8')
-    assert full_name in html
+def _section_headings(html: str) -> list[str]:
+    """<h2> texts in document order, entity-decoded and without the '(N)' count"""
+    return [
+        _COUNT_SUFFIX_RE.sub('', heading.text_content()).strip()
+        for heading in lxml_html.fromstring(html).iter('h2')
+    ]
 
 
-def test_validation_pack_section_order(tmp_path: Path) -> None:
+@pytest.fixture(scope='module')
+def perez_pack(tmp_path_factory, install_fixture):
+    """Generate the HTML pack for the Perez fixture once for the module"""
     if not FIXTURE_PATH.exists():
         pytest.skip(f"Fixture not found: {FIXTURE_PATH}")
 
+    tmp_path = tmp_path_factory.mktemp('perez_pack')
     input_dir = tmp_path / 'input'
     output_dir = tmp_path / 'out'
     input_dir.mkdir()
 
     fixture_copy = input_dir / FIXTURE_PATH.name
-    shutil.copyfile(FIXTURE_PATH, fixture_copy)
+    install_fixture(FIXTURE_PATH, fixture_copy)
 
     generate_validation_pack(input_dir, output_dir, ['html'])
 
     data = json.loads(fixture_copy.read_text(encoding='utf-8'))
     lattes_id = data['researcher']['lattes_id']
     html_path = output_dir / 'researchers' / f'{lattes_id}__' / 'VALIDACAO.html'
+    return data, html_path
+
+
+def test_generate_validation_pack_html(perez_pack) -> None:
+    data, html_path = perez_pack
+    assert html_path.exists()
+
     html = html_path.read_text(encoding='utf-8')
+    assert data['researcher']['full_name'] in html
 
-    headings = [
-        re.sub(r'\s*\(\d+\)\s*$', '', heading).strip()
-        for heading in re.findall(r'<h2>(.*?)</h2>', html)
-    ]
-    productions = data.get('productions', [])
-    grouped = {}
+
+def test_validation_pack_section_order(perez_pack) -> None:
+    data, html_path = perez_pack
+    html = html_path.read_text(encoding='utf-8')
+
+    headings = _section_headings(html)
+    # First label per section key, in first-seen order; _ordered_section_names
+    # only consults the keys of its grouping, so labels stands in for it
     labels = {}
-    for item in productions:
+    for item in data.get('productions', []):
         key, label = _section_identity(item)
-        if key not in grouped:
-            grouped[key] = []
-        if key not in labels:
-            labels[key] = label
+        labels.setdefault(key, label)
 
-    section_order = _ordered_section_names(data.get('metadata', {}).get('sections', []), grouped)
+    section_order = _ordered_section_names(data.get('metadata', {}).get('sections', []), labels)
     expected = [labels[key] for key in section_order]
 
     assert headings == expected
@@ -95,10 +93,7 @@ def test_validation_pack_sections_from_fraceto(tmp_path: Path) -> None:
     lattes_id = result['lattes_id']
     html_path = output_dir / 'researchers' / f'{lattes_id}__' / 'VALIDACAO.html'
     html = html_path.read_text(encoding='utf-8')
-    headings = [
-        re.sub(r'\s*\(\d+\)\s*$', '', heading).strip()
-        for heading in re.findall(r'<h2>(.*?)</h2>', html)
-    ]
+    headings = _section_headings(html)
 
     assert len(set(headings)) > 1
     assert any(heading != 'Produções' for heading in headings)
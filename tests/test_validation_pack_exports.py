@@ -3,8 +3,8 @@
 from pathlib import Path
 import json
 import re
-import shutil
 
+import pytest
 from openpyxl import load_workbook
 
 from metricas_lattes.exports.validation_pack import COLUMN_ORDER, generate_validation_pack
@@ -12,6 +12,9 @@ from metricas_lattes.exports.validation_pack import COLUMN_ORDER, generate_valid
 
 FIXTURE_PATH = Path('tests/fixtures/validation_pack/carlos_alberto_perez.json')
 
+_YEAR_WORD_RE = re.compile(r'\b(19|20)\d{2}\b')
+_YEAR_FULL_RE = re.compile(r'(19|20)\d{2}')
+
 
 def _is_year(value) -> bool:
     if value is None:
@@ -19,17 +22,20 @@ def _is_year(value) -> bool:
     if isinstance(value, int):
         return 1900 <= value <= 2100
     if isinstance(value, str):
-        return re.match(r'^(19|20)\d{2}$', value.strip()) is not None
+        return _YEAR_FULL_RE.fullmatch(value.strip()) is not None
     return False
 
 
-def test_xlsx_column_alignment(tmp_path: Path) -> None:
+@pytest.fixture(scope='module')
+def perez_workbook(tmp_path_factory, install_fixture):
+    """Generate the Perez XLSX pack once and share the loaded workbook"""
+    tmp_path = tmp_path_factory.mktemp('perez_xlsx')
     input_dir = tmp_path / 'input'
     output_dir = tmp_path / 'out'
     input_dir.mkdir()
 
     fixture_copy = input_dir / FIXTURE_PATH.name
-    shutil.copyfile(FIXTURE_PATH, fixture_copy)
+    install_fixture(FIXTURE_PATH, fixture_copy)
 
     generate_validation_pack(input_dir, output_dir, ['xlsx'])
 
@@ -38,14 +44,21 @@ def test_xlsx_column_alignment(tmp_path: Path) -> None:
     xlsx_path = output_dir / 'researchers' / f'{lattes_id}__' / 'VALIDACAO.xlsx'
     assert xlsx_path.exists()
 
-    workbook = load_workbook(xlsx_path, data_only=True)
+    workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+    yield workbook
+    workbook.close()
+
+
+def test_xlsx_column_alignment(perez_workbook) -> None:
+    workbook = perez_workbook
     assert 'Produções' in workbook.sheetnames
 
     sheet = workbook['Produções']
-    header = [cell.value for cell in sheet[1]]
+    rows = sheet.iter_rows(max_row=2, values_only=True)
+    header = list(next(rows))
     assert header == COLUMN_ORDER
 
-    first_row = [cell.value for cell in sheet[2]]
+    first_row = next(rows)
     col_index = {name: idx for idx, name in enumerate(header)}
 
     ano_value = first_row[col_index['ano']]
@@ -66,30 +79,16 @@ def _find_row_by_title(sheet, header, needle: str):
     return None, col_index
 
 
-def test_validation_pack_field_fallbacks(tmp_path: Path) -> None:
-    input_dir = tmp_path / 'input'
-    output_dir = tmp_path / 'out'
-    input_dir.mkdir()
-
-    fixture_copy = input_dir / FIXTURE_PATH.name
-    shutil.copyfile(FIXTURE_PATH, fixture_copy)
-
-    generate_validation_pack(input_dir, output_dir, ['xlsx'])
-
-    data = json.loads(fixture_copy.read_text(encoding='utf-8'))
-    lattes_id = data['researcher']['lattes_id']
-    xlsx_path = output_dir / 'researchers' / f'{lattes_id}__' / 'VALIDACAO.xlsx'
-
-    workbook = load_workbook(xlsx_path, data_only=True)
-    sheet = workbook['Produções']
-    header = [cell.value for cell in sheet[1]]
+def test_validation_pack_field_fallbacks(perez_workbook) -> None:
+    sheet = perez_workbook['Produções']
+    header = next(sheet.iter_rows(max_row=1, values_only=True))
 
     row, col_index = _find_row_by_title(sheet, header, 'SiC Structural Analysis')
     assert row is not None
     autores_value = row[col_index['autores']]
     veiculo_value = row[col_index['veiculo_ou_livro']]
     assert isinstance(autores_value, str)
-    assert re.search(r'\b(19|20)\d{2}\b', autores_value) is None
+    assert _YEAR_WORD_RE.search(autores_value) is None
     assert isinstance(veiculo_value, str) and veiculo_value.strip()
 
     row, col_index = _find_row_by_title(sheet, header, 'THE TXRF TECHNIQUE AT THE LNLS')
@@ -2,8 +2,9 @@
 
 from pathlib import Path
 import json
-
-from openpyxl import load_workbook
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
 
 from metricas_lattes.exports.validation_pack import (
     COLUMN_ORDER,
@@ -11,16 +12,71 @@ from metricas_lattes.exports.validation_pack import (
 )
 
 
-def _extract_ids_from_sheet(sheet) -> list[tuple[str, int | None, str | None]]:
-    header = [cell.value for cell in sheet[1]]
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_ROW_TAG = f'{{{_MAIN_NS}}}row'
+_CELL_TAG = f'{{{_MAIN_NS}}}c'
+_VALUE_TAG = f'{{{_MAIN_NS}}}v'
+_INLINE_TEXT_PATH = f'{{{_MAIN_NS}}}is/{{{_MAIN_NS}}}t'
+
+
+def _sheet_member(archive: zipfile.ZipFile, sheet_name: str) -> str | None:
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{{{_PKG_REL_NS}}}Relationship')}
+    for sheet in workbook.iter(f'{{{_MAIN_NS}}}sheet'):
+        if sheet.get('name') == sheet_name:
+            target = targets[sheet.get(f'{{{_REL_NS}}}id')]
+            return target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+    return None
+
+
+def _column_index(cell_ref: str) -> int:
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _cell_value(cell: ET.Element) -> str | int | float | None:
+    # The validation pack writer emits inline strings, so no sharedStrings lookup is needed
+    if cell.get('t') == 'inlineStr':
+        return cell.findtext(_INLINE_TEXT_PATH)
+    raw = cell.findtext(_VALUE_TAG)
+    if raw is None or cell.get('t') in ('str', 'e'):
+        return raw
+    return float(raw) if any(char in raw for char in '.Ee') else int(raw)
+
+
+def _stream_sheet_rows(archive: zipfile.ZipFile, member: str):
+    """Yield row values straight from the sheet XML, without openpyxl cell objects."""
+    with archive.open(member) as handle:
+        for _, element in ET.iterparse(handle, events=('end',)):
+            if element.tag != _ROW_TAG:
+                continue
+            values: list[str | int | float | None] = []
+            for cell in element.iter(_CELL_TAG):
+                column = _column_index(cell.get('r', ''))
+                if column >= len(values):
+                    values.extend([None] * (column + 1 - len(values)))
+                values[column] = _cell_value(cell)
+            element.clear()
+            yield tuple(values)
+
+
+def _extract_ids_from_rows(rows) -> list[tuple[str, int | None, str | None]]:
+    header = next(rows)
     col_index = {name: idx for idx, name in enumerate(header)}
+    i_section = col_index['section']
+    i_numero = col_index['numero_item']
+    i_titulo = col_index['titulo']
     ids: list[tuple[str, int | None, str | None]] = []
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if row is None:
-            continue
-        section = row[col_index['section']]
-        numero_item = row[col_index['numero_item']]
-        titulo = row[col_index['titulo']]
+    for row in rows:
+        row += (None,) * (len(header) - len(row))
+        section, numero_item, titulo = row[i_section], row[i_numero], row[i_titulo]
         if section is None and numero_item is None and titulo is None:
             continue
         ids.append((section or '', numero_item, titulo))
@@ -70,17 +126,18 @@ def test_validation_pack_preserves_input_order_xlsx(tmp_path: Path) -> None:
     generate_validation_pack(input_dir, output_dir, ['xlsx'])
 
     xlsx_path = output_dir / 'researchers' / '123__' / 'VALIDACAO.xlsx'
-    workbook = load_workbook(xlsx_path, data_only=True)
-    assert 'Produções' in workbook.sheetnames
-
-    sheet = workbook['Produções']
-    header = [cell.value for cell in sheet[1]]
-    assert header == COLUMN_ORDER
-
     expected = [
         (item['source']['production_type'], item['numero_item'], item['titulo'])
         for item in data['productions']
     ]
-    observed = _extract_ids_from_sheet(sheet)
+
+    with zipfile.ZipFile(xlsx_path) as archive:
+        member = _sheet_member(archive, 'Produções')
+        assert member is not None
+
+        header = list(next(_stream_sheet_rows(archive, member)))
+        assert header == COLUMN_ORDER
+
+        observed = _extract_ids_from_rows(_stream_sheet_rows(archive, member))
 
     assert observed == expected
@@ -1,4 +1,8 @@
-"""Tests for year filtering in batch_full_profile."""
+"""Tests for year filtering in batch_full_profile.
+
+The end-to-end metadata check parses the full Fraceto profile, so it is marked
+slow and only runs with `pytest -m slow` (or `-m ""`).
+"""
 
 import json
 from pathlib import Path
@@ -40,6 +44,7 @@ def test_parse_years_arg():
     assert parse_years_arg("2023, 2024") == [2023, 2024]
 
 
+@pytest.mark.slow
 def test_batch_default_filter_metadata(tmp_path: Path):
     fixture_path = Path("tests/fixtures/lattes/full_profile/full_profile_leonardo_fraceto.html")
     if not fixture_path.exists():
@@ -57,7 +62,7 @@ def test_batch_default_filter_metadata(tmp_path: Path):
     )
 
     json_path = Path(result["output_json"])
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data = json.loads(json_path.read_bytes())
     assert data["metadata"]["filters"]["years"] == [2024, 2025]
 
     productions = data["productions"]
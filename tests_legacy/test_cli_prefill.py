@@ -1,44 +1,83 @@
-"""Integration tests for CLI prefill tool"""
+"""Integration tests for CLI prefill tool
 
+The end-to-end subprocess test is marked slow and only runs with
+`pytest -m slow` (or `-m ""`); the rest call the CLI in-process.
+"""
+
+import contextlib
+import importlib.util
+import io
 import json
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
 
+CLI_SCRIPT = Path(__file__).parent.parent / 'scripts' / 'prefill_from_lattes.py'
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@lru_cache(maxsize=1)
+def _load_cli_module():
+    spec = importlib.util.spec_from_file_location('prefill_from_lattes', CLI_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_cli(*args):
+    """Run the CLI in-process; returns (exit code, stdout, stderr)"""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = _load_cli_module().main(list(args))
+        except SystemExit as exc:
+            rc = exc.code
+    return rc, out.getvalue(), err.getvalue()
+
+
+def read_prefill_jsonl(path):
+    """Load a --jsonl prefill file; returns (profile, errors) records"""
+    records = {}
+    for line in path.read_bytes().splitlines():
+        record = json.loads(line)
+        records[record.pop('kind')] = record
+    return records['profile'], records['errors']
+
+
 @pytest.fixture
 def fixture_path():
     """Path to article sample fixture"""
-    return Path(__file__).parent / 'fixtures' / 'artigo_sample.html'
+    return FIXTURES_DIR / 'artigo_sample.html'
 
 
 @pytest.fixture
-def output_dir():
-    """Output directory for prefill JSON"""
-    return Path(__file__).parent.parent / 'docs' / 'prefill'
+def output_dir(tmp_path):
+    """Per-test output directory for prefill JSON"""
+    return tmp_path / 'prefill'
 
 
 @pytest.fixture
 def cli_script():
     """Path to CLI script"""
-    return Path(__file__).parent.parent / 'scripts' / 'prefill_from_lattes.py'
+    return CLI_SCRIPT
 
 
+@pytest.mark.slow
 def test_cli_basic_usage(fixture_path, output_dir, cli_script):
     """Test basic CLI usage with sample fixture"""
-    # Clean up if exists
     output_file = output_dir / "test_researcher.json"
     errors_file = output_dir / "test_researcher.errors.json"
-    if output_file.exists():
-        output_file.unlink()
-    if errors_file.exists():
-        errors_file.unlink()
-    
-    # Run CLI
+
+    # Run CLI end-to-end in a fresh interpreter (the other tests run in-process)
     result = subprocess.run(
-        [sys.executable, str(cli_script), str(fixture_path), '--pesquisador', 'test_researcher'],
+        [sys.executable, str(cli_script), str(fixture_path), '--pesquisador', 'test_researcher',
+         '--output-dir', str(output_dir)],
         capture_output=True,
         text=True
     )
@@ -51,8 +90,7 @@ def test_cli_basic_usage(fixture_path, output_dir, cli_script):
     assert errors_file.exists()
     
     # Load and validate main JSON
-    with open(output_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = json.loads(output_file.read_bytes())
     
     assert data['pesquisador'] == 'test_researcher'
     assert 'generated_at' in data
@@ -80,70 +118,142 @@ def test_cli_basic_usage(fixture_path, output_dir, cli_script):
     assert articles[2]['ordem_lattes'] == 3
     
     # Load and validate errors JSON
-    with open(errors_file, 'r', encoding='utf-8') as f:
-        errors_data = json.load(f)
+    errors_data = json.loads(errors_file.read_bytes())
     
     assert errors_data['pesquisador'] == 'test_researcher'
     assert errors_data['source_html'] == 'artigo_sample.html'
     assert 'errors' in errors_data
     assert errors_data['errors'] == []  # No errors in sample fixture
-    
-    # Clean up
-    output_file.unlink()
-    errors_file.unlink()
 
 
-def test_cli_missing_input_file(cli_script):
-    """Test CLI with missing input file"""
-    result = subprocess.run(
-        [sys.executable, str(cli_script), 'nonexistent.html', '--pesquisador', 'test'],
-        capture_output=True,
-        text=True
+PREFILL_SLUGS = ['test_researcher', '__artigos__', '__artigos_0__', 'x"__artigos_0__"']
+PREFILL_ARTICLES = [
+    [],
+    [
+        {'categoria': 'artigo', 'titulo': 'Título com acento', 'ordem_lattes': 1},
+        {'categoria': 'artigo', 'titulo': '__artigos_1__', 'autores': 'A; B'},
+    ],
+]
+
+
+def _prefill_output_data(slug):
+    return {
+        "pesquisador": slug,
+        "generated_at": "2025-01-01T00:00:00+00:00",
+        "source_html": f"{slug}.html",
+        "producoes": {},
+        "counts": {"artigos": 0},
+    }
+
+
+@pytest.mark.parametrize('artigos', PREFILL_ARTICLES)
+@pytest.mark.parametrize('slug', PREFILL_SLUGS)
+def test_write_prefill_json_matches_json_dumps(tmp_path, slug, artigos):
+    """Streamed prefill JSON is the same text as a one-shot json.dumps"""
+    output_data = _prefill_output_data(slug)
+    output_file = tmp_path / 'out.json'
+
+    _load_cli_module().write_prefill_json(output_file, output_data, iter(artigos))
+
+    expected = dict(output_data, producoes={'artigos': artigos})
+    assert output_file.read_text(encoding='utf-8') == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize('artigos', PREFILL_ARTICLES)
+@pytest.mark.parametrize('slug', PREFILL_SLUGS)
+def test_write_prefill_jsonl_matches_json_output(tmp_path, slug, artigos):
+    """Each --jsonl record is the matching JSON output plus its kind"""
+    cli = _load_cli_module()
+    output_data = _prefill_output_data(slug)
+    errors_data = {"pesquisador": slug, "source_html": f"{slug}.html", "errors": []}
+    json_file = tmp_path / 'out.json'
+    jsonl_file = tmp_path / 'out.jsonl'
+
+    cli.write_prefill_json(json_file, output_data, iter(artigos))
+    cli.write_prefill_jsonl(jsonl_file, output_data, iter(artigos), errors_data)
+
+    profile_line, errors_line = jsonl_file.read_text(encoding='utf-8').splitlines()
+    expected = dict(output_data, producoes={'artigos': artigos})
+    assert json.loads(profile_line) == {'kind': 'profile', **json.loads(json_file.read_bytes())}
+    assert profile_line == json.dumps({'kind': 'profile', **expected}, ensure_ascii=False)
+    assert json.loads(errors_line) == {'kind': 'errors', **errors_data}
+
+
+def test_cli_jsonl_matches_json_output(output_dir, tmp_path):
+    """--jsonl writes the same profile and errors as the two-file layout"""
+    html = tmp_path / "one.html"
+    html.write_text(
+        '<div class="artigo-completo"><div class="layout-cell-1"><b>1.</b></div>'
+        '<div class="layout-cell-11"><span class="transform">'
+        'AUTHOR, A. . Title. Journal, v. 1, p. 1-5, 2024.</span></div></div>',
+        encoding='utf-8',
     )
+
+    for extra in ([], ['--jsonl']):
+        rc, _, _ = run_cli(str(html), '--pesquisador', '__artigos__', '--output-dir', str(output_dir), *extra)
+        assert rc == 0
+
+    data = json.loads((output_dir / '__artigos__.json').read_bytes())
+    errors_data = json.loads((output_dir / '__artigos__.errors.json').read_bytes())
+    profile, jsonl_errors = read_prefill_jsonl(output_dir / '__artigos__.jsonl')
+
+    # The two runs differ only in their timestamp
+    data.pop('generated_at')
+    profile.pop('generated_at')
+    assert profile == data
+    assert jsonl_errors == errors_data
+    assert data['pesquisador'] == '__artigos__'
+    assert data['counts']['artigos'] == len(data['producoes']['artigos']) == 1
+
+
+def test_cli_missing_input_file():
+    """Test CLI with missing input file"""
+    rc, _, err = run_cli('nonexistent.html', '--pesquisador', 'test')
     
     # Should exit with code 2
-    assert result.returncode == 2
-    assert 'not found' in result.stderr.lower()
+    assert rc == 2
+    assert 'not found' in err.lower()
 
 
-def test_cli_conflicting_input_args(fixture_path, cli_script):
-    """Test CLI with both positional and --input flag"""
-    result = subprocess.run(
-        [sys.executable, str(cli_script), str(fixture_path), '--input', str(fixture_path), '--pesquisador', 'test'],
-        capture_output=True,
-        text=True
+def test_cli_rejects_non_utf8_input(output_dir, tmp_path):
+    """Test CLI exits 2 on input that is not UTF-8 instead of guessing an encoding"""
+    latin1_html = tmp_path / "latin1.html"
+    latin1_html.write_bytes(
+        '<div class="artigo-completo"><div class="layout-cell-1"><b>1.</b></div>'
+        '<div class="layout-cell-11"><span class="transform">'
+        'AUTOR, A. . Título com acentuação. Revista, v. 1, p. 1-5, 2024.</span></div></div>'.encode('latin-1')
     )
+
+    rc, _, err = run_cli(str(latin1_html), '--pesquisador', 'test_latin1', '--output-dir', str(output_dir))
+
+    assert rc == 2
+    assert 'failed to read input file' in err.lower()
+    assert not (output_dir / 'test_latin1.json').exists()
+
+
+def test_cli_conflicting_input_args(fixture_path):
+    """Test CLI with both positional and --input flag"""
+    rc, _, err = run_cli(str(fixture_path), '--input', str(fixture_path), '--pesquisador', 'test')
     
     # Should exit with code 2
-    assert result.returncode == 2
-    assert 'cannot specify both' in result.stderr.lower()
+    assert rc == 2
+    assert 'cannot specify both' in err.lower()
 
 
-def test_cli_alternative_input_flag(fixture_path, output_dir, cli_script):
+def test_cli_alternative_input_flag(fixture_path, output_dir):
     """Test CLI with --input flag"""
-    output_file = output_dir / "test_alt.json"
-    errors_file = output_dir / "test_alt.errors.json"
-    if output_file.exists():
-        output_file.unlink()
-    if errors_file.exists():
-        errors_file.unlink()
-    
-    result = subprocess.run(
-        [sys.executable, str(cli_script), '--input', str(fixture_path), '--pesquisador', 'test_alt'],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0
-    assert output_file.exists()
-    assert errors_file.exists()
+    output_file = output_dir / "test_alt.jsonl"
+
+    rc, _, _ = run_cli('--input', str(fixture_path), '--pesquisador', 'test_alt', '--output-dir', str(output_dir),
+                       '--jsonl')
     
-    # Clean up
-    output_file.unlink()
-    errors_file.unlink()
+    assert rc == 0
+    data, errors_data = read_prefill_jsonl(output_file)
+    assert data['counts']['artigos'] == 3
+    assert errors_data['errors'] == []
 
 
-def test_cli_with_errors(output_dir, cli_script, tmp_path):
+def test_cli_with_errors(output_dir, tmp_path):
     """Test CLI handles parsing errors correctly"""
     # Create malformed HTML
     malformed_html = tmp_path / "malformed.html"
@@ -163,43 +273,27 @@ def test_cli_with_errors(output_dir, cli_script, tmp_path):
     </div>
     """, encoding='utf-8')
     
-    output_file = output_dir / "test_errors.json"
-    errors_file = output_dir / "test_errors.errors.json"
-    if output_file.exists():
-        output_file.unlink()
-    if errors_file.exists():
-        errors_file.unlink()
-    
-    result = subprocess.run(
-        [sys.executable, str(cli_script), str(malformed_html), '--pesquisador', 'test_errors'],
-        capture_output=True,
-        text=True
-    )
+    output_file = output_dir / "test_errors.jsonl"
+
+    rc, _, _ = run_cli(str(malformed_html), '--pesquisador', 'test_errors', '--output-dir', str(output_dir),
+                       '--jsonl')
     
     # Should still exit 0
-    assert result.returncode == 0
+    assert rc == 0
     
     # Check errors were logged
-    with open(errors_file, 'r', encoding='utf-8') as f:
-        errors_data = json.load(f)
+    data, errors_data = read_prefill_jsonl(output_file)
     
     assert len(errors_data['errors']) == 1
     assert errors_data['errors'][0]['ordem_lattes'] == 1
     assert errors_data['errors'][0]['reason'] == 'missing_structure'
     
     # Check valid article was parsed
-    with open(output_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     assert data['counts']['artigos'] == 1
     assert data['producoes']['artigos'][0]['ordem_lattes'] == 2
-    
-    # Clean up
-    output_file.unlink()
-    errors_file.unlink()
 
 
-def test_cli_sorting_with_none_ordem(output_dir, cli_script, tmp_path):
+def test_cli_sorting_with_none_ordem(output_dir, tmp_path):
     """Test deterministic sorting with None ordem_lattes values"""
     # Create HTML with missing ordem values
     html_with_none = tmp_path / "mixed_ordem.html"
@@ -231,23 +325,14 @@ def test_cli_sorting_with_none_ordem(output_dir, cli_script, tmp_path):
     </div>
     """, encoding='utf-8')
     
-    output_file = output_dir / "test_sorting.json"
-    errors_file = output_dir / "test_sorting.errors.json"
-    if output_file.exists():
-        output_file.unlink()
-    if errors_file.exists():
-        errors_file.unlink()
-    
-    result = subprocess.run(
-        [sys.executable, str(cli_script), str(html_with_none), '--pesquisador', 'test_sorting'],
-        capture_output=True,
-        text=True
-    )
+    output_file = output_dir / "test_sorting.jsonl"
+
+    rc, _, _ = run_cli(str(html_with_none), '--pesquisador', 'test_sorting', '--output-dir', str(output_dir),
+                       '--jsonl')
     
-    assert result.returncode == 0
+    assert rc == 0
     
-    with open(output_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data, _ = read_prefill_jsonl(output_file)
     
     articles = data['producoes']['artigos']
     assert len(articles) == 3
@@ -260,8 +345,4 @@ def test_cli_sorting_with_none_ordem(output_dir, cli_script, tmp_path):
     assert articles[1]['ordem_lattes'] is None
     assert 'Beta title' in articles[1]['titulo']
     assert articles[2]['ordem_lattes'] is None
-    assert 'Zebra title' in articles[2]['titulo']
-    
-    # Clean up
-    output_file.unlink()
-    errors_file.unlink()
\ No newline at end of file
+    assert 'Zebra title' in articles[2]['titulo']
\ No newline at end of file
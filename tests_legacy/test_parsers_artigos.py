@@ -5,11 +5,20 @@ from pathlib import Path
 from metricas_lattes.parsers.artigos import ArtigoParser
 
 
-@pytest.fixture
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope='session')
 def sample_html():
     """Load sample HTML fixture"""
-    fixture_path = Path(__file__).parent / 'fixtures' / 'artigo_sample.html'
-    return fixture_path.read_text(encoding='utf-8')
+    # Raw bytes; the parser hands them to lxml as UTF-8
+    return (FIXTURES_DIR / 'artigo_sample.html').read_bytes()
+
+
+@pytest.fixture(scope='session')
+def parsed_articles(sample_html):
+    """Parse the sample fixture once; tests only read the result"""
+    return ArtigoParser().parse_html(sample_html)
 
 
 @pytest.fixture
@@ -18,60 +27,51 @@ def parser():
     return ArtigoParser()
 
 
-def test_parse_multiple_articles(parser, sample_html):
+def test_parse_multiple_articles(parsed_articles):
     """Test parsing multiple articles from HTML"""
-    articles = parser.parse_html(sample_html)
+    articles = parsed_articles
     
     assert len(articles) == 3
     assert all(a.categoria == "artigo" for a in articles)
 
 
-def test_parse_complete_article(parser, sample_html):
-    """Test parsing article with all fields"""
-    articles = parser.parse_html(sample_html)
-    
-    # First article has all fields
-    first = articles[0]
-    assert first.ordem_lattes == 1
-    assert first.titulo == "Nanotechnology applications in agriculture: A comprehensive review"
-    assert first.autores == "SILVA, J. A.; SANTOS, M. B.; OLIVEIRA, P. C."
-    assert first.veiculo == "Journal of Agricultural Science"
-    assert first.volume == "142"
-    assert first.paginas == "1-15"
-    assert first.ano == 2024
-    assert first.doi == "10.1234/jas.2024.001"
+ARTICLE_FIELDS = [
+    (0, 'ordem_lattes', 1),
+    (0, 'titulo', "Nanotechnology applications in agriculture: A comprehensive review"),
+    (0, 'autores', "SILVA, J. A.; SANTOS, M. B.; OLIVEIRA, P. C."),
+    (0, 'veiculo', "Journal of Agricultural Science"),
+    (0, 'volume', "142"),
+    (0, 'paginas', "1-15"),
+    (0, 'ano', 2024),
+    (0, 'doi', "10.1234/jas.2024.001"),
+    (1, 'ordem_lattes', 2),
+    (1, 'titulo', "Polymeric nanoparticles for pesticide delivery"),
+    (1, 'autores', "FRACETO, L. F.; GRILLO, R.; MEDINA, V."),
+    (1, 'doi', None),
+    (1, 'ano', 2023),
+    (2, 'ordem_lattes', 3),
+    (2, 'titulo', "Sustainable nanotechnology in crop protection"),
+    (2, 'autores', "COSTA, A. R."),
+    (2, 'veiculo', "Nature Nanotechnology"),
+    (2, 'volume', "17"),
+    (2, 'ano', 2022),
+    (2, 'doi', "10.1038/nnano.2022.123"),
+]
+
+
+@pytest.mark.parametrize('idx,field,expected', ARTICLE_FIELDS)
+def test_article_fields(parsed_articles, idx, field, expected):
+    """Each sample article field is extracted as expected"""
+    assert getattr(parsed_articles[idx], field) == expected
+
+
+def test_first_article_keeps_trace(parsed_articles):
+    """First article keeps its traceability fields"""
+    first = parsed_articles[0]
     assert first.raw_text is not None
     assert first.html_snippet is not None
 
 
-def test_parse_article_without_doi(parser, sample_html):
-    """Test parsing article without DOI"""
-    articles = parser.parse_html(sample_html)
-    
-    # Second article has no DOI
-    second = articles[1]
-    assert second.ordem_lattes == 2
-    assert second.titulo == "Polymeric nanoparticles for pesticide delivery"
-    assert second.autores == "FRACETO, L. F.; GRILLO, R.; MEDINA, V."
-    assert second.doi is None
-    assert second.ano == 2023
-
-
-def test_parse_article_missing_pages(parser, sample_html):
-    """Test parsing article with incomplete metadata"""
-    articles = parser.parse_html(sample_html)
-    
-    # Third article missing pages
-    third = articles[2]
-    assert third.ordem_lattes == 3
-    assert third.titulo == "Sustainable nanotechnology in crop protection"
-    assert third.autores == "COSTA, A. R."
-    assert third.veiculo == "Nature Nanotechnology"
-    assert third.volume == "17"
-    assert third.ano == 2022
-    assert third.doi == "10.1038/nnano.2022.123"
-
-
 def test_extract_ordem_lattes(parser):
     """Test extraction of Lattes numbering"""
     html = """
@@ -80,35 +80,36 @@ def test_extract_ordem_lattes(parser):
     </div>
     """
     from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     div = soup.find('div', class_='artigo-completo')
     
     ordem = parser._extract_ordem_lattes(div)
     assert ordem == 42
 
 
-def test_extract_doi_variations(parser):
+DOI_HTML = """
+<div class="artigo-completo">
+    <a class="icone-doi" href="https://doi.org/10.1234/test"></a>
+</div>
+"""
+
+DX_DOI_HTML = """
+<div class="artigo-completo">
+    <a class="icone-doi" href="https://dx.doi.org/10.5678/test2"></a>
+</div>
+"""
+
+
+@pytest.mark.parametrize('html,expected_doi', [
+    (DOI_HTML, "10.1234/test"),
+    (DX_DOI_HTML, "10.5678/test2"),
+])
+def test_extract_doi_variations(parser, html, expected_doi):
     """Test DOI extraction with different URL formats"""
-    html_doi = """
-    <div class="artigo-completo">
-        <a class="icone-doi" href="https://doi.org/10.1234/test"></a>
-    </div>
-    """
-    html_dx_doi = """
-    <div class="artigo-completo">
-        <a class="icone-doi" href="https://dx.doi.org/10.5678/test2"></a>
-    </div>
-    """
-    
     from bs4 import BeautifulSoup
     
-    div1 = BeautifulSoup(html_doi, 'html.parser').find('div')
-    doi1 = parser._extract_doi(div1)
-    assert doi1 == "10.1234/test"
-    
-    div2 = BeautifulSoup(html_dx_doi, 'html.parser').find('div')
-    doi2 = parser._extract_doi(div2)
-    assert doi2 == "10.5678/test2"
+    div = BeautifulSoup(html, 'lxml').find('div')
+    assert parser._extract_doi(div) == expected_doi
 
 
 def test_clean_text_normalization(parser):
@@ -125,9 +126,9 @@ def test_normalize_author_name(parser):
     assert normalized == "SILVA, João A."
 
 
-def test_to_dict_without_trace(parser, sample_html):
+def test_to_dict_without_trace(parsed_articles):
     """Test export without traceability fields"""
-    articles = parser.parse_html(sample_html)
+    articles = parsed_articles
     first = articles[0]
     
     d = first.to_dict(include_trace=False)
@@ -137,9 +138,9 @@ def test_to_dict_without_trace(parser, sample_html):
     assert 'autores' in d
 
 
-def test_to_dict_with_trace(parser, sample_html):
+def test_to_dict_with_trace(parsed_articles):
     """Test export with traceability fields"""
-    articles = parser.parse_html(sample_html)
+    articles = parsed_articles
     first = articles[0]
     
     d = first.to_dict(include_trace=True)
@@ -147,6 +148,22 @@ def test_to_dict_with_trace(parser, sample_html):
     assert 'html_snippet' in d
 
 
+def test_utf8_bytes_match_str(parser):
+    """Test UTF-8 bytes parse the same as the decoded text"""
+    html = '<div class="artigo-completo"><div class="layout-cell-1"><b>1.</b></div><div class="layout-cell-11"><span class="transform">AUTOR, A. . Título. Revista, v. 1, p. 1-5, 2024.</span></div></div>'
+    from_str = [p.to_dict() for p in parser.parse_html(html)]
+    from_bytes = [p.to_dict() for p in parser.parse_html(html.encode('utf-8'))]
+    assert from_bytes == from_str
+    assert len(from_bytes) == 1
+
+
+def test_non_utf8_bytes_rejected(parser):
+    """Test bytes that are not UTF-8 raise instead of being decoded by guesswork"""
+    html = '<div class="artigo-completo"><div class="layout-cell-1"><b>1.</b></div><div class="layout-cell-11"><span class="transform">AUTOR, A. . Título. Revista, v. 1, p. 1-5, 2024.</span></div></div>'
+    with pytest.raises(ValueError, match="not valid UTF-8"):
+        parser.parse_html(html.encode('latin-1'))
+
+
 def test_empty_html(parser):
     """Test parsing empty HTML"""
     articles = parser.parse_html("")
@@ -240,7 +257,7 @@ def test_error_tracking_exception(parser, monkeypatch):
     def mock_extract_metadata(self, texto):
         raise ValueError("Forced test exception")
     
-    monkeypatch.setattr(parser, '_extract_metadata', mock_extract_metadata.__get__(parser, ArtigoParser))
+    monkeypatch.setattr(ArtigoParser, '_extract_metadata', mock_extract_metadata)
     
     articles = parser.parse_html(html)
     
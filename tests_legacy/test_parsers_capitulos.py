@@ -5,11 +5,20 @@ from pathlib import Path
 from metricas_lattes.parsers.capitulos import CapituloParser
 
 
-@pytest.fixture
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope='session')
 def sample_html():
     """Load sample HTML fixture"""
-    fixture_path = Path(__file__).parent / 'fixtures' / 'capitulo_sample.html'
-    return fixture_path.read_text(encoding='utf-8')
+    # Raw bytes; the parser hands them to lxml as UTF-8
+    return (FIXTURES_DIR / 'capitulo_sample.html').read_bytes()
+
+
+@pytest.fixture(scope='session')
+def parsed_chapters(sample_html):
+    """Parse the sample fixture once; tests only read the result"""
+    return CapituloParser().parse_html(sample_html)
 
 
 @pytest.fixture
@@ -18,64 +27,55 @@ def parser():
     return CapituloParser()
 
 
-def test_parse_multiple_chapters(parser, sample_html):
+def test_parse_multiple_chapters(parsed_chapters):
     """Test parsing multiple chapters from HTML"""
-    chapters = parser.parse_html(sample_html)
+    chapters = parsed_chapters
     
     assert len(chapters) == 3
     assert all(c.categoria == "capitulo" for c in chapters)
 
 
-def test_parse_complete_chapter(parser, sample_html):
-    """Test parsing chapter with all fields"""
-    chapters = parser.parse_html(sample_html)
-    
-    # First chapter has all basic fields
-    first = chapters[0]
-    assert first.ordem_lattes == 1
-    assert first.titulo == "Nanotechnology in sustainable agriculture"
-    assert first.autores == "SILVA, J. A.; SANTOS, M. B."
-    assert first.livro == "Advances in Agricultural Science"
-    assert first.editora == "Editora Científica"
-    assert first.edicao == "1"
-    assert first.ano == 2024
-    assert first.paginas == "45-67"
-    assert first.doi == "10.1234/book.2024.001"
-    assert first.isbn is None
+CHAPTER_FIELDS = [
+    (0, 'ordem_lattes', 1),
+    (0, 'titulo', "Nanotechnology in sustainable agriculture"),
+    (0, 'autores', "SILVA, J. A.; SANTOS, M. B."),
+    (0, 'livro', "Advances in Agricultural Science"),
+    (0, 'editora', "Editora Científica"),
+    (0, 'edicao', "1"),
+    (0, 'ano', 2024),
+    (0, 'paginas', "45-67"),
+    (0, 'doi', "10.1234/book.2024.001"),
+    (0, 'isbn', None),
+    (1, 'ordem_lattes', 2),
+    (1, 'titulo', "Polymeric nanoparticles for pesticide delivery systems"),
+    (1, 'autores', "FRACETO, L. F.; GRILLO, R."),
+    (1, 'livro', "Nanomaterials in Agriculture"),
+    (1, 'edicao', "2"),
+    (1, 'ano', 2023),
+    (1, 'isbn', "978-85-1234-567-8"),
+    (1, 'doi', None),
+    (2, 'ordem_lattes', 3),
+    (2, 'titulo', "Environmental impact of nanotechnology"),
+    (2, 'autores', "MEDINA, V."),
+    (2, 'livro', "Green Technologies"),
+    (2, 'ano', 2022),
+    (2, 'doi', "10.5678/green.2022.003"),
+]
+
+
+@pytest.mark.parametrize('idx,field,expected', CHAPTER_FIELDS)
+def test_chapter_fields(parsed_chapters, idx, field, expected):
+    """Each sample chapter field is extracted as expected"""
+    assert getattr(parsed_chapters[idx], field) == expected
+
+
+def test_first_chapter_keeps_trace(parsed_chapters):
+    """First chapter keeps its traceability fields"""
+    first = parsed_chapters[0]
     assert first.raw_text is not None
     assert first.html_snippet is not None
 
 
-def test_parse_chapter_with_isbn(parser, sample_html):
-    """Test parsing chapter with ISBN"""
-    chapters = parser.parse_html(sample_html)
-    
-    # Second chapter has ISBN
-    second = chapters[1]
-    assert second.ordem_lattes == 2
-    assert second.titulo == "Polymeric nanoparticles for pesticide delivery systems"
-    assert second.autores == "FRACETO, L. F.; GRILLO, R."
-    assert second.livro == "Nanomaterials in Agriculture"
-    assert second.edicao == "2"
-    assert second.ano == 2023
-    assert second.isbn == "978-85-1234-567-8"
-    assert second.doi is None
-
-
-def test_parse_chapter_without_isbn_or_doi(parser, sample_html):
-    """Test parsing chapter with minimal metadata"""
-    chapters = parser.parse_html(sample_html)
-    
-    # Third chapter
-    third = chapters[2]
-    assert third.ordem_lattes == 3
-    assert third.titulo == "Environmental impact of nanotechnology"
-    assert third.autores == "MEDINA, V."
-    assert third.livro == "Green Technologies"
-    assert third.ano == 2022
-    assert third.doi == "10.5678/green.2022.003"
-
-
 def test_extract_doi_variations(parser):
     """Test DOI extraction with different URL formats"""
     html = """
@@ -103,9 +103,9 @@ def test_extract_isbn(parser):
     assert chapters[0].isbn == "978-1-234-56789-0"
 
 
-def test_to_dict_without_trace(parser, sample_html):
+def test_to_dict_without_trace(parsed_chapters):
     """Test export without traceability fields"""
-    chapters = parser.parse_html(sample_html)
+    chapters = parsed_chapters
     first = chapters[0]
     
     d = first.to_dict(include_trace=False)
@@ -115,9 +115,9 @@ def test_to_dict_without_trace(parser, sample_html):
     assert 'autores' in d
 
 
-def test_to_dict_with_trace(parser, sample_html):
+def test_to_dict_with_trace(parsed_chapters):
     """Test export with traceability fields"""
-    chapters = parser.parse_html(sample_html)
+    chapters = parsed_chapters
     first = chapters[0]
     
     d = first.to_dict(include_trace=True)
@@ -125,6 +125,22 @@ def test_to_dict_with_trace(parser, sample_html):
     assert 'html_snippet' in d
 
 
+def test_utf8_bytes_match_str(parser):
+    """Test UTF-8 bytes parse the same as the decoded text"""
+    html = '<div class="layout-cell-11"><span class="transform">AUTOR. Título. In: EDITOR (Org.). Livro. 1ed. Cidade: Editora, 2024, p. 1-5.</span></div>'
+    from_str = [p.to_dict() for p in parser.parse_html(html)]
+    from_bytes = [p.to_dict() for p in parser.parse_html(html.encode('utf-8'))]
+    assert from_bytes == from_str
+    assert len(from_bytes) == 1
+
+
+def test_non_utf8_bytes_rejected(parser):
+    """Test bytes that are not UTF-8 raise instead of being decoded by guesswork"""
+    html = '<div class="layout-cell-11"><span class="transform">AUTOR. Título. In: EDITOR (Org.). Livro. 1ed. Cidade: Editora, 2024, p. 1-5.</span></div>'
+    with pytest.raises(ValueError, match="not valid UTF-8"):
+        parser.parse_html(html.encode('latin-1'))
+
+
 def test_empty_html(parser):
     """Test parsing empty HTML"""
     chapters = parser.parse_html("")